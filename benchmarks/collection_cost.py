@@ -0,0 +1,67 @@
+"""
+Benchmark do custo da coleta de processos: duas fases (status só para quem precisa) contra ler o status de todos.
+
+Opcionalmente cria processos ociosos (`sleep`) para simular um host com muitos PIDs.
+Uso: python benchmarks/collection_cost.py [--scans 20] [--spawn 2000]
+"""
+import argparse
+import os
+import queue
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import Model
+
+def average_status_size(pids):
+    """
+    Tamanho médio (em bytes) de /proc/<pid>/status, para estimar o I/O economizado.
+    """
+    sizes = []
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/status", "rb") as f:
+                sizes.append(len(f.read()))
+        except OSError:
+            continue
+    return sum(sizes) / len(sizes) if sizes else 0
+
+def measure(status_top_n, scans):
+    """
+    Roda `scans` coletas (depois de uma de aquecimento).
+    Return: (tempo médio por coleta em ms, média de leituras de stat, média de leituras de status)
+    """
+    model = Model(queue.Queue(), queue.Queue(), queue.Queue(), queue.Queue(), status_top_n=status_top_n)
+    model._get_processes_data()
+    elapsed = 0.0
+    stat_reads = status_reads = 0
+    for _ in range(scans):
+        start = time.perf_counter()
+        model._get_processes_data()
+        elapsed += time.perf_counter() - start
+        stat_reads += model._last_scan_reads[0]
+        status_reads += model._last_scan_reads[1]
+    return elapsed / scans * 1000, stat_reads / scans, status_reads / scans
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scans", type=int, default=20)
+    parser.add_argument("--spawn", type=int, default=0, help="processos ociosos a criar antes de medir")
+    args = parser.parse_args()
+
+    children = [subprocess.Popen(["sleep", "600"]) for _ in range(args.spawn)]
+    try:
+        status_size = average_status_size([p.pid for p in children] or os.listdir("/proc")[:200])
+        full_ms, procs, full_status = measure(10 ** 9, args.scans)
+        two_phase_ms, _, two_phase_status = measure(50, args.scans)
+        saved = (full_status - two_phase_status) * status_size
+        print(f"processes:      {procs:.0f}")
+        print(f"status for all: {full_ms:8.2f} ms/scan  {full_status:8.0f} status reads")
+        print(f"two-phase:      {two_phase_ms:8.2f} ms/scan  {two_phase_status:8.0f} status reads")
+        print(f"saved:          {full_ms - two_phase_ms:8.2f} ms/scan  ~{saved / 1024:.0f} KB of status read+parsed per scan")
+    finally:
+        for child in children:
+            child.kill()
+            child.wait()
@@ -0,0 +1,93 @@
+"""
+Benchmark de latência de frame da UI com os coletores na mesma thread/processo e em um processo separado.
+
+Simula o loop da UI sem abrir janela (mesma cadência de um mainloop do Tk com after(16)): a cada frame consome os
+dados dos coletores como o Controller faz e mede o atraso entre o horário previsto do frame e o fim do trabalho dele.
+Uso: python benchmarks/ui_latency.py [--seconds 10] [--dt 0.2]
+"""
+import argparse
+import os
+import queue
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import Model
+from collector_process import CollectorProcess, SLOT_SIZES
+import multiprocessing
+
+FRAME = 0.016   # ~60 FPS
+
+def run_frames(consume, seconds):
+    """
+    Roda o loop de frames por `seconds` segundos chamando consume() em cada um.
+    Return: lista de latências (em ms)
+    """
+    latencies = []
+    next_frame = time.perf_counter() + FRAME
+    end = next_frame + seconds
+    while next_frame < end:
+        delay = next_frame - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        consume()
+        latencies.append((time.perf_counter() - next_frame) * 1000)
+        next_frame += FRAME
+    return latencies
+
+def in_process(seconds, dt):
+    # Mesmas threads e queues do Controller (e do processo coletor), para comparar a mesma carga
+    req_queue = queue.Queue()
+    data_queues = {kind: queue.Queue() for kind in SLOT_SIZES}
+    model = Model(data_queues['processes'], data_queues['specific_processes'], req_queue,
+                  data_queues['general_stats'], data_queues['cgroups'], data_queues['hot_threads'],
+                  data_queues['short_lived'], data_queues['pressure'], DT=dt)
+    model.start_processes_thread()
+    model.start_specific_processes_thread()
+    model.start_general_stats_thread()
+    model.start_cgroups_thread()
+    model.start_hot_threads_thread()
+    model.start_short_lived_thread()
+    model.start_pressure_thread()
+
+    def consume():
+        for data_queue in data_queues.values():
+            try:
+                data_queue.get_nowait()
+            except queue.Empty:
+                pass
+    try:
+        return run_frames(consume, seconds)
+    finally:
+        model.stop_processes_thread()
+        model.stop_specific_processes_thread()
+        model.stop_general_stats_thread()
+        model.stop_cgroups_thread()
+        model.stop_hot_threads_thread()
+        model.stop_short_lived_thread()
+        model.stop_pressure_thread()
+
+def separate_process(seconds, dt):
+    collector = CollectorProcess(multiprocessing.Queue(), DT=dt)
+    collector.start()
+    try:
+        return run_frames(collector.read, seconds)
+    finally:
+        collector.stop()
+
+def report(name, latencies):
+    latencies = sorted(latencies)
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))]
+    print(f"{name:<18} frames={len(latencies):<6} p50={pct(50):6.2f}ms  p95={pct(95):6.2f}ms  "
+          f"p99={pct(99):6.2f}ms  max={latencies[-1]:6.2f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--dt", type=float, default=0.2, help="intervalo entre coletas")
+    args = parser.parse_args()
+
+    report("threads", in_process(args.seconds, args.dt))
+    report("separate process", separate_process(args.seconds, args.dt))
@@ -0,0 +1,223 @@
+from multiprocessing import shared_memory
+import multiprocessing
+import pickle
+import queue
+import struct
+import sys
+
+# Tipos de dados publicados pelo coletor e o tamanho de cada slot (em bytes) no buffer compartilhado
+SLOT_SIZES = {
+    'processes': 16 * 1024 * 1024,
+    'specific_processes': 4 * 1024 * 1024,
+    'general_stats': 1024 * 1024,
+    'cgroups': 4 * 1024 * 1024,
+    'hot_threads': 1024 * 1024,
+    'short_lived': 1024 * 1024,
+    'pressure': 64 * 1024,
+}
+
+
+class SharedSnapshotBuffer:
+    """
+    Classe SharedSnapshotBuffer para publicar snapshots do coletor em memória compartilhada.
+    Cada tipo de dado tem seu próprio canal, com buffer duplo e seqlock próprios: o escritor grava sempre no slot
+    inativo do canal e só depois incrementa o número de sequência dele. Assim o leitor checa se há dados novos lendo
+    apenas o cabeçalho e só desserializa os tipos que mudaram (um tick de PSI não faz a lista de processos ser
+    reserializada e relida).
+    Layout: [cabeçalho do canal 0]...[cabeçalho do canal N][slots 0 e 1 do canal 0]...[slots 0 e 1 do canal N]
+    Cabeçalho de cada canal: [seq][write_seq][len slot 0][len slot 1]
+    """
+    _CHANNEL = struct.Struct("QQQQ")
+    _SEQ = 0          # Último snapshot completo do canal
+    _WRITE_SEQ = 8    # Snapshot do canal sendo escrito (seqlock)
+    _LENGTHS = 16
+
+    def __init__(self, slot_sizes, name=None):
+        # Canais {tipo: (offset do cabeçalho, offset dos slots, tamanho de cada slot)}, na ordem de slot_sizes
+        # (os dois lados precisam usar o mesmo slot_sizes)
+        self._channels = {}
+        data_offset = self._CHANNEL.size * len(slot_sizes)
+        for index, (kind, slot_size) in enumerate(slot_sizes.items()):
+            self._channels[kind] = (index * self._CHANNEL.size, data_offset, slot_size)
+            data_offset += 2 * slot_size
+        if name is None:
+            # Cria o segmento (lado da UI, dono do buffer)
+            self._shm = shared_memory.SharedMemory(create=True, size=data_offset)
+            self._owner = True
+            self._shm.buf[:self._CHANNEL.size * len(slot_sizes)] = bytes(self._CHANNEL.size * len(slot_sizes))
+        else:
+            # Conecta a um segmento existente (lado do coletor)
+            self._shm = shared_memory.SharedMemory(name=name)
+            self._owner = False
+        self.name = self._shm.name
+
+    def sequence(self, kind):
+        """
+        Retorna o número de sequência do último snapshot publicado no canal (0 se nenhum).
+        """
+        return struct.unpack_from("Q", self._shm.buf, self._channels[kind][0] + self._SEQ)[0]
+
+    def write(self, kind, data):
+        """
+        Serializa e publica os dados de um tipo no slot inativo do canal dele.
+        Return: True se publicado, False se os dados não cabem no slot.
+        """
+        header, slots, slot_size = self._channels[kind]
+        data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > slot_size:
+            return False
+        seq = self.sequence(kind) + 1
+        slot = seq % 2
+        offset = slots + slot * slot_size
+        # Marca o slot como em escrita antes de tocar nele
+        struct.pack_into("Q", self._shm.buf, header + self._WRITE_SEQ, seq)
+        self._shm.buf[offset:offset + len(data)] = data
+        struct.pack_into("Q", self._shm.buf, header + self._LENGTHS + 8 * slot, len(data))
+        # Só publica (incrementa seq) depois que o slot está completo
+        struct.pack_into("Q", self._shm.buf, header + self._SEQ, seq)
+        return True
+
+    def read(self, kind, last_seq=0):
+        """
+        Lê os dados mais recentes de um tipo se forem mais novos que last_seq.
+        Return: (seq, dados) ou (last_seq, None) se não houver dados novos.
+        """
+        header, slots, slot_size = self._channels[kind]
+        while True:
+            seq = self.sequence(kind)
+            if seq == last_seq or seq == 0:
+                return last_seq, None
+            slot = seq % 2
+            length = struct.unpack_from("Q", self._shm.buf, header + self._LENGTHS + 8 * slot)[0]
+            offset = slots + slot * slot_size
+            view = self._shm.buf[offset:offset + length]
+            try:
+                data = pickle.loads(view)
+                valid = True
+            except Exception:
+                data = None
+                valid = False
+            finally:
+                view.release()
+            # Se o escritor começou a gravar no mesmo slot durante a leitura, os dados podem estar corrompidos: tenta de novo
+            write_seq = struct.unpack_from("Q", self._shm.buf, header + self._WRITE_SEQ)[0]
+            if valid and write_seq - seq < 2:
+                return seq, data
+
+    def close(self):
+        """
+        Fecha o segmento (e remove, se for o dono).
+        """
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+def _collector_main(buffer_name, slot_sizes, specific_processes_req_queue, stop_event, DT, model_options):
+    """
+    Rodando no processo filho.
+    Inicia as threads do Model e publica no buffer compartilhado o último dado de cada tipo que mudou
+    (cada tipo no seu canal).
+    """
+    from model import Model
+
+    buffer = SharedSnapshotBuffer(slot_sizes, name=buffer_name)
+    queues = {kind: queue.Queue() for kind in slot_sizes}
+    model = Model(queues['processes'], queues['specific_processes'], specific_processes_req_queue,
+                  queues['general_stats'], queues['cgroups'], queues['hot_threads'], queues['short_lived'],
+                  queues['pressure'], DT=DT, **model_options)
+    model.start_processes_thread()
+    model.start_specific_processes_thread()
+    model.start_general_stats_thread()
+    model.start_cgroups_thread()
+    model.start_hot_threads_thread()
+    model.start_short_lived_thread()
+    model.start_pressure_thread()
+
+    # Tipos cujo último dado não coube no slot (o aviso só é impresso quando começa a falhar)
+    oversized = set()
+    try:
+        while not stop_event.is_set():
+            for kind, data_queue in queues.items():
+                # Só o dado mais recente de cada tipo é publicado
+                changed = False
+                try:
+                    while True:
+                        data = data_queue.get_nowait()
+                        changed = True
+                except queue.Empty:
+                    pass
+                if not changed:
+                    continue
+                if buffer.write(kind, data):
+                    oversized.discard(kind)
+                elif kind not in oversized:
+                    oversized.add(kind)
+                    print(f"collector: '{kind}' snapshot larger than its {slot_sizes[kind]} byte slot, "
+                          f"not published (raise SLOT_SIZES['{kind}'])", file=sys.stderr)
+            stop_event.wait(0.05)
+    finally:
+        model.stop_processes_thread()
+        model.stop_specific_processes_thread()
+        model.stop_general_stats_thread()
+        model.stop_cgroups_thread()
+        model.stop_hot_threads_thread()
+        model.stop_short_lived_thread()
+        model.stop_pressure_thread()
+        buffer.close()
+
+
+class CollectorProcess:
+    """
+    Classe CollectorProcess para rodar os coletores do Model em um processo filho.
+    Assim a coleta não disputa o GIL com o mainloop do Tk: a UI só lê o número de sequência do buffer compartilhado
+    e desserializa os dados de um tipo só quando eles mudam.
+    """
+    def __init__(self, specific_processes_req_queue, DT=1, slot_sizes=None, model_options=None):
+        # Queue de requests (View -> processo coletor), deve ser um multiprocessing.Queue
+        self.specific_processes_req_queue = specific_processes_req_queue
+        self._DT = DT
+        self._model_options = model_options or {}
+        self._slot_sizes = slot_sizes or SLOT_SIZES
+        self._buffer = SharedSnapshotBuffer(self._slot_sizes)
+        self._stop_event = multiprocessing.Event()
+        self._process = None
+        self._kind_seqs = {}    # Última sequência lida de cada tipo
+
+    def start(self):
+        """
+        Inicia o processo coletor.
+        """
+        self._stop_event.clear()
+        self._process = multiprocessing.Process(target=_collector_main,
+                                                args=(self._buffer.name, self._slot_sizes,
+                                                      self.specific_processes_req_queue,
+                                                      self._stop_event, self._DT, self._model_options),
+                                                daemon=True)
+        self._process.start()
+
+    def stop(self):
+        """
+        Encerra o processo coletor e libera o buffer compartilhado.
+        """
+        self._stop_event.set()
+        if self._process:
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+        self._buffer.close()
+
+    def read(self):
+        """
+        Checa o buffer de forma não-bloqueante.
+        Return: Dictionary {tipo: dados} só com os tipos que mudaram desde a última leitura (vazio se nada mudou).
+        """
+        changed = {}
+        for kind in self._slot_sizes:
+            last_seq = self._kind_seqs.get(kind, 0)
+            seq, data = self._buffer.read(kind, last_seq)
+            if seq != last_seq:
+                self._kind_seqs[kind] = seq
+                changed[kind] = data
+        return changed
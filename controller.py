@@ -1,30 +1,75 @@
 from view import View
 from model import Model
 import queue
+import sys
+import time
 
 class Controller:
     """
     Classe Controller para intermediar a interação entre View e Model.
     Inicializa o Model e a View, inicia as threads e lida com o fluxo de dados.
     """
-    def __init__(self):
+    def __init__(self, separate_process=False, model_options=None, metrics_port=None, metrics_top_n=50,
+                 startup_times=None):
+        # Marcos de tempo da inicialização (perf_counter), para o relatório de startup (None desabilita)
+        self.startup_times = startup_times
+        # Se True, os coletores rodam em um processo filho (ver collector_process.py)
+        self.separate_process = separate_process
+        # Parâmetros extras do Model (ex.: orçamento da amostragem de smaps_rollup)
+        model_options = model_options or {}
+
         # Queue para lista de processos (Model -> View)
         self.process_queue = queue.Queue()
         # Queue para processos especificos (Model -> View)
         self.specific_process_queue = queue.Queue()
         # Queue para requests de processos específicos (View -> Model)
-        self.specific_process_req_queue = queue.Queue()
+        # (atravessa processos se o coletor for separado)
+        if separate_process:
+            import multiprocessing
+            self.specific_process_req_queue = multiprocessing.Queue()
+        else:
+            self.specific_process_req_queue = queue.Queue()
         # Queue para dados gerais de sistema (Model -> View)
         self.general_stats_queue = queue.Queue()
+        # Queue para dados agregados por cgroup (Model -> View)
+        self.cgroups_queue = queue.Queue()
+        # Queue para o ranking de hot threads (Model -> View)
+        self.hot_threads_queue = queue.Queue()
+        # Queue para o resumo de processos de vida curta (Model -> View)
+        self.short_lived_queue = queue.Queue()
+        # Queue para o PSI do sistema (Model -> View)
+        self.pressure_queue = queue.Queue()
 
-        # Inicializa View e Model
+        # Inicializa View e Model (ou o processo coletor)
         self.view = View(self.specific_process_req_queue)
-        self.model = Model(self.process_queue, self.specific_process_queue, self.specific_process_req_queue, self.general_stats_queue)
+        if self.startup_times is not None:
+            self.startup_times['window'] = time.perf_counter()
+        if separate_process:
+            from collector_process import CollectorProcess
+            self.model = None
+            self.collector = CollectorProcess(self.specific_process_req_queue, model_options=model_options)
+            self.collector.start()
+        else:
+            self.collector = None
+            self.model = Model(self.process_queue, self.specific_process_queue, self.specific_process_req_queue, self.general_stats_queue,
+                               self.cgroups_queue, self.hot_threads_queue, self.short_lived_queue,
+                               self.pressure_queue, **model_options)
+
+            # Inicia threads de data gathering
+            self.model.start_processes_thread()
+            self.model.start_specific_processes_thread()
+            self.model.start_general_stats_thread()
+            self.model.start_cgroups_thread()
+            self.model.start_hot_threads_thread()
+            self.model.start_short_lived_thread()
+            self.model.start_pressure_thread()
 
-        # Inicia threads de data gathering
-        self.model.start_processes_thread()
-        self.model.start_specific_processes_thread()
-        self.model.start_general_stats_thread()
+        # Endpoint OpenMetrics opcional (só importado se habilitado)
+        self.exporter = None
+        if metrics_port:
+            from exporter import MetricsExporter
+            self.exporter = MetricsExporter(port=metrics_port, top_n=metrics_top_n)
+            self.exporter.start()
 
         # Agendar a checagem das queues para atualizar a View com os dados do Model
         self.queue_check()
@@ -34,6 +79,9 @@ class Controller:
         Checa as queues usando um método não-bloqueante (para a GUI permanecer ativa).
         O método é chamado periodicamente (100ms).
         """
+        if self.collector:
+            self.snapshot_check()
+            return
         try:
             processes = self.process_queue.get_nowait()
         except queue.Empty:
@@ -46,16 +94,74 @@ class Controller:
             general_stats = self.general_stats_queue.get_nowait()
         except queue.Empty:
             general_stats = None
+        try:
+            cgroups = self.cgroups_queue.get_nowait()
+        except queue.Empty:
+            cgroups = None
+        try:
+            hot_threads = self.hot_threads_queue.get_nowait()
+        except queue.Empty:
+            hot_threads = None
+        try:
+            short_lived = self.short_lived_queue.get_nowait()
+        except queue.Empty:
+            short_lived = None
+        try:
+            pressure = self.pressure_queue.get_nowait()
+        except queue.Empty:
+            pressure = None
         
         # Se houver dados em pelo menos uma das queues, atualiza a View
         # (se algum for nulo, a View toma conta de não atualizar a tela com ele)
-        if processes or specific_processes or general_stats:
+        if processes or specific_processes or general_stats or cgroups or hot_threads or short_lived or pressure:
         # Atualiza a View com os dados recebidos do Model
-            self.view.update_data(processes, specific_processes, general_stats)
+            self.publish_data(processes, specific_processes, general_stats, cgroups, hot_threads, short_lived,
+                              pressure)
 
         # Agenda próxima checagem das queues
         self.view.root.after(100, self.queue_check)
 
+    def snapshot_check(self):
+        """
+        Equivalente ao queue_check quando o coletor roda em outro processo.
+        Só lê o número de sequência do buffer compartilhado; o snapshot só é desserializado se mudou.
+        """
+        changed = self.collector.read()
+        processes = changed.get('processes')
+        specific_processes = changed.get('specific_processes')
+        general_stats = changed.get('general_stats')
+        cgroups = changed.get('cgroups')
+        hot_threads = changed.get('hot_threads')
+        short_lived = changed.get('short_lived')
+        pressure = changed.get('pressure')
+        if processes or specific_processes or general_stats or cgroups or hot_threads or short_lived or pressure:
+            self.publish_data(processes, specific_processes, general_stats, cgroups, hot_threads, short_lived,
+                              pressure)
+
+        self.view.root.after(100, self.queue_check)
+
+    def publish_data(self, processes, specific_processes, general_stats, cgroups, hot_threads=None, short_lived=None,
+                     pressure=None):
+        """
+        Repassa os dados recebidos do Model para a View e para o exportador de métricas (se habilitado).
+        """
+        self.view.update_data(processes, specific_processes, general_stats, cgroups, hot_threads, short_lived,
+                              pressure)
+        if processes and self.startup_times is not None and 'first_data' not in self.startup_times:
+            self.startup_times['first_data'] = time.perf_counter()
+            self.report_startup()
+        if self.exporter:
+            self.exporter.update(processes, general_stats, cgroups)
+
+    def report_startup(self):
+        """
+        Imprime (em stderr) o tempo até cada marco da inicialização: imports, janela desenhada e primeiros dados reais.
+        """
+        start = self.startup_times['start']
+        report = ", ".join(f"{name} {(self.startup_times[name] - start) * 1000:.0f} ms"
+                           for name in ('imports', 'window', 'first_data') if name in self.startup_times)
+        print(f"startup: {report}", file=sys.stderr)
+
     def run(self):
         """
         Roda o loop principal da View. Fica bloqueado até a GUI ser fechada, então as threads do Model são fechadas.
@@ -68,6 +174,15 @@ class Controller:
         Para as threads do Model.
         É chamado quando a GUI é fechada.
         """
+        if self.exporter:
+            self.exporter.stop()
+        if self.collector:
+            self.collector.stop()
+            return
         self.model.stop_processes_thread()
         self.model.stop_specific_processes_thread()
-        self.model.stop_general_stats_thread()
\ No newline at end of file
+        self.model.stop_general_stats_thread()
+        self.model.stop_cgroups_thread()
+        self.model.stop_hot_threads_thread()
+        self.model.stop_short_lived_thread()
+        self.model.stop_pressure_thread()
\ No newline at end of file
@@ -0,0 +1,163 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+class MetricsExporter:
+    """
+    Classe MetricsExporter para expor os dados coletados pelo Model em formato OpenMetrics (Prometheus) via HTTP.
+    O corpo da resposta é renderizado no máximo uma vez por coleta e servido do cache, então vários scrapers
+    simultâneos não custam nada a mais. Só os top-N processos por CPU e por RSS são exportados (limite de cardinalidade).
+    """
+    CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+    def __init__(self, port=9101, host="127.0.0.1", top_n=50):
+        self._address = (host, port)
+        self._top_n = top_n
+        self._server = None
+        self._thread = None
+
+        # Últimos dados recebidos e cache da resposta renderizada
+        self._lock = threading.Lock()
+        self._processes = {}
+        self._general_stats = []
+        self._cgroups = []
+        self._generation = 0            # Incrementa a cada coleta recebida
+        self._cached_generation = -1    # Geração usada para renderizar o cache
+        self._cached_body = b""
+
+    def start(self):
+        """
+        Inicia o servidor HTTP em uma thread separada.
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render()
+                self.send_response(200)
+                self.send_header("Content-Type", MetricsExporter.CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Sem log a cada scrape
+                pass
+
+        self._server = ThreadingHTTPServer(self._address, Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Encerra o servidor HTTP.
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def update(self, processes=None, general_stats=None, cgroups=None):
+        """
+        Recebe os dados de uma coleta (os argumentos nulos mantêm os dados anteriores).
+        Chamado pelo Controller junto com a atualização da View.
+        """
+        if not (processes or general_stats or cgroups):
+            return
+        with self._lock:
+            if processes:
+                self._processes = processes
+            if general_stats:
+                self._general_stats = general_stats
+            if cgroups:
+                self._cgroups = cgroups
+            self._generation += 1
+
+    def render(self):
+        """
+        Retorna o corpo da resposta, renderizando só se houve coleta nova desde a última renderização.
+        """
+        with self._lock:
+            if self._cached_generation != self._generation:
+                self._cached_body = self._render_metrics().encode("utf-8")
+                self._cached_generation = self._generation
+            return self._cached_body
+
+    def _render_metrics(self):
+        """
+        Monta o texto OpenMetrics com os dados atuais.
+        """
+        lines = []
+
+        def metric(name, help_text, samples, metric_type="gauge"):
+            # samples: List [(labels, valor)]
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"# HELP {name} {help_text}")
+            for labels, value in samples:
+                if isinstance(value, str):
+                    continue
+                label_text = ",".join(f'{key}="{self._escape(val)}"' for key, val in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+        general = self._general_stats
+        if general:
+            metric("dashboard_cpu_usage_percent", "CPU usage per CPU (cpu is the total).",
+                   [({"cpu": cpu}, usage) for cpu, usage in general[6]])
+            total_memory, used_memory, total_swap, used_swap = general[13]
+            metric("dashboard_memory_total_bytes", "Total memory.", [({}, total_memory * 1024)])
+            metric("dashboard_memory_used_bytes", "Used memory (without buffers and cache).", [({}, used_memory * 1024)])
+            metric("dashboard_swap_total_bytes", "Total swap.", [({}, total_swap * 1024)])
+            metric("dashboard_swap_used_bytes", "Used swap.", [({}, used_swap * 1024)])
+            metric("dashboard_processes", "Number of processes.", [({}, general[7])])
+            metric("dashboard_threads", "Number of threads.", [({}, general[8])])
+            metric("dashboard_load_average", "Load average.",
+                   [({"period": period}, load) for period, load in zip(("1m", "5m", "15m"), general[9])])
+            metric("dashboard_disk_read_bytes_per_second", "Disk read rate.",
+                   [({"device": device}, read_rate * 1024 * 1024) for device, read_rate, _ in general[11]])
+            metric("dashboard_disk_written_bytes_per_second", "Disk write rate.",
+                   [({"device": device}, write_rate * 1024 * 1024) for device, _, write_rate in general[11]])
+            metric("dashboard_network_received_bytes_per_second", "Network receive rate.",
+                   [({"interface": name}, rx_rate * 1024 * 1024) for name, rx_rate, _ in general[12]])
+            metric("dashboard_network_transmitted_bytes_per_second", "Network transmit rate.",
+                   [({"interface": name}, tx_rate * 1024 * 1024) for name, _, tx_rate in general[12]])
+
+        if self._processes:
+            # Limite de cardinalidade: união dos top-N por CPU e por RSS
+            processes = list(self._processes.values())
+            top = {p[0]: p for p in sorted(processes, key=lambda p: p[5], reverse=True)[:self._top_n]}
+            top.update({p[0]: p for p in sorted(processes, key=lambda p: p[12], reverse=True)[:self._top_n]})
+
+            def labels(process):
+                return {"pid": process[0], "name": process[1], "user": process[2]}
+            metric("dashboard_process_cpu_usage_percent", "Process CPU usage (top processes only).",
+                   [(labels(p), p[5]) for p in top.values()])
+            metric("dashboard_process_resident_memory_bytes", "Process resident memory (top processes only).",
+                   [(labels(p), p[12] * 1024) for p in top.values()])
+            metric("dashboard_process_disk_read_bytes_per_second", "Process disk read rate (top processes only).",
+                   [(labels(p), p[7] if isinstance(p[7], str) else p[7] * 1024 * 1024) for p in top.values()])
+            metric("dashboard_process_disk_written_bytes_per_second", "Process disk write rate (top processes only).",
+                   [(labels(p), p[8] if isinstance(p[8], str) else p[8] * 1024 * 1024) for p in top.values()])
+
+        if self._cgroups:
+            metric("dashboard_cgroup_cpu_usage_percent", "cgroup CPU usage.",
+                   [({"cgroup": c[0]}, c[1]) for c in self._cgroups])
+            metric("dashboard_cgroup_disk_read_bytes_per_second", "cgroup disk read rate.",
+                   [({"cgroup": c[0]}, c[5] * 1024 * 1024) for c in self._cgroups])
+            metric("dashboard_cgroup_disk_written_bytes_per_second", "cgroup disk write rate.",
+                   [({"cgroup": c[0]}, c[6] * 1024 * 1024) for c in self._cgroups])
+            stall_labels = (("cpu", "some"), ("memory", "some"), ("memory", "full"), ("io", "some"), ("io", "full"))
+            metric("dashboard_cgroup_pressure_stall_percent", "cgroup share of time stalled (PSI) since the last collection.",
+                   [({"cgroup": c[0], "resource": resource, "kind": kind}, rate)
+                    for c in self._cgroups for (resource, kind), rate in zip(stall_labels, c[8])])
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _escape(self, value):
+        """
+        Escapa um valor de label (barra invertida, aspas e quebra de linha).
+        """
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,256 @@
+import tkinter as tk
+from collections import deque
+
+class SparklineGraph:
+    """
+    Classe SparklineGraph para desenhar uma série temporal (gráfico de área) em um Canvas do Tk.
+    A cada valor novo o desenho existente é deslocado e só um segmento é acrescentado, então o custo por tick é
+    constante e o número de itens no canvas é limitado pela largura em pixels, não pelo tamanho do histórico.
+    """
+    def __init__(self, master, height=40, step=3, max_value=100.0, color="#00bc8c", fill="#0b4f40",
+                 background="#222222"):
+        self.canvas = tk.Canvas(master, height=height, background=background, highlightthickness=0)
+        self._height = height
+        self._step = step               # Pixels entre dois pontos
+        self._max_value = max_value     # Valor no topo do gráfico (None para escala automática)
+        self._scale = max_value or 1.0
+        self._peak = 0.0                # Maior valor visível, que define a escala automática
+        self._color = color
+        self._fill = fill
+
+        # Valores visíveis e ids dos itens de cada segmento desenhado [(area, linha)]
+        self._values = deque()
+        self._segments = deque()
+        self._label = self.canvas.create_text(4, 2, anchor='nw', fill="#ffffff", text="")
+
+        # Se o canvas mudar de tamanho, redesenha tudo (único caso de redesenho completo além da escala)
+        self.canvas.bind('<Configure>', lambda event: self.redraw())
+
+    def append(self, value, label=None):
+        """
+        Acrescenta um valor à série (e atualiza o texto sobreposto, se informado).
+        """
+        width = self._width()
+        max_points = width // self._step + 2
+        self._values.append(value)
+        peak_removed = False
+        while len(self._values) > max_points:
+            if self._values.popleft() >= self._peak:
+                peak_removed = True
+
+        if self._max_value is None and value > self._scale:
+            # Escala automática: valor acima do topo, redesenha com a nova escala
+            self.redraw()
+        elif self._max_value is None and peak_removed and self._auto_scale() != self._scale:
+            # O valor que definia a escala saiu da janela: a escala acompanha os valores visíveis
+            self.redraw()
+        elif len(self._values) >= 2:
+            # Desloca o desenho para a esquerda e acrescenta só o segmento novo
+            self.canvas.move('segment', -self._step, 0)
+            self._draw_segment(self._values[-2], self._values[-1], width - self._step, width)
+            while len(self._segments) > max_points:
+                for item in self._segments.popleft():
+                    self.canvas.delete(item)
+
+        if label is not None:
+            self.canvas.itemconfigure(self._label, text=label)
+            self.canvas.tag_raise(self._label)
+
+    def redraw(self):
+        """
+        Redesenha a série inteira (custo limitado pela largura do canvas).
+        """
+        self.canvas.delete('segment')
+        self._segments.clear()
+        if self._max_value is None:
+            self._peak = max(self._values, default=0)
+            self._scale = self._auto_scale()
+        width = self._width()
+        count = len(self._values)
+        for idx in range(1, count):
+            x2 = width - (count - 1 - idx) * self._step
+            self._draw_segment(self._values[idx - 1], self._values[idx], x2 - self._step, x2)
+        self.canvas.tag_raise(self._label)
+
+    def _auto_scale(self):
+        """
+        Topo da escala automática para os valores visíveis (25% acima do maior).
+        """
+        return max(max(self._values, default=0) * 1.25, 1.0)
+
+    def _draw_segment(self, prev_value, value, x1, x2):
+        """
+        Desenha um segmento (área preenchida + linha) entre dois pontos consecutivos.
+        """
+        y1 = self._y(prev_value)
+        y2 = self._y(value)
+        area = self.canvas.create_polygon(x1, self._height, x1, y1, x2, y2, x2, self._height,
+                                          fill=self._fill, outline='', tags='segment')
+        line = self.canvas.create_line(x1, y1, x2, y2, fill=self._color, tags='segment')
+        self._segments.append((area, line))
+
+    def _y(self, value):
+        """
+        Converte um valor na coordenada y do canvas.
+        """
+        ratio = min(max(value / self._scale, 0.0), 1.0)
+        return self._height - 1 - ratio * (self._height - 2)
+
+    def _width(self):
+        """
+        Largura atual do canvas (antes de ser mapeado, usa a largura configurada).
+        """
+        width = self.canvas.winfo_width()
+        return width if width > 1 else int(self.canvas.cget('width'))
+
+
+class HeatmapGrid:
+    """
+    Classe HeatmapGrid para mostrar um valor (0-100) por célula, colorido por faixa, em um Canvas do Tk.
+    Pensada para o uso por CPU lógica em máquinas com muitos núcleos: as células podem ser agrupadas (ex.: por socket
+    ou nó NUMA), e a cada atualização só as células cuja faixa de cor mudou são repintadas.
+    """
+    _LEVELS = 20    # Número de faixas de cor (5% cada)
+
+    def __init__(self, master, cell=14, gap=2, label_width=60, background="#222222"):
+        self.canvas = tk.Canvas(master, height=cell, background=background, highlightthickness=0)
+        self._cell = cell
+        self._gap = gap
+        self._label_width = label_width     # Espaço à esquerda para o nome do grupo
+        self._palette = [self._color(level / self._LEVELS) for level in range(self._LEVELS + 1)]
+
+        # Estado desenhado: nomes e grupos das células, ids dos retângulos e faixa de cor atual de cada um
+        self._names = []
+        self._groups = []
+        self._items = []
+        self._levels = []
+        self._values = []
+        self._layout_width = 0
+        self._tooltip = None
+
+        self.canvas.bind('<Configure>', lambda event: self._on_resize())
+        self.canvas.bind('<Motion>', self._on_motion)
+        self.canvas.bind('<Leave>', lambda event: self._hide_tooltip())
+
+    def update(self, values, groups=None):
+        """
+        Atualiza as células.
+        values: List [(nome, valor)], uma célula por item
+        groups: List com o rótulo do grupo de cada célula (ex.: "Node 0"), ou None para uma grade única
+        """
+        names = [name for name, _ in values]
+        groups = list(groups) if groups is not None else [None] * len(values)
+        self._values = [value for _, value in values]
+        if names != self._names or groups != self._groups:
+            # Conjunto de células ou agrupamento mudou: refaz o layout
+            self._names = names
+            self._groups = groups
+            self._layout()
+            return
+
+        for idx, value in enumerate(self._values):
+            level = self._level(value)
+            if level != self._levels[idx]:
+                self._levels[idx] = level
+                self.canvas.itemconfigure(self._items[idx], fill=self._palette[level])
+
+    def _layout(self):
+        """
+        Recria todas as células (só quando o número de células, o agrupamento ou a largura do canvas mudam).
+        As células de cada grupo ficam em um bloco de linhas próprio, com o nome do grupo à esquerda.
+        """
+        self.canvas.delete('all')
+        self._tooltip = None
+        self._items = []
+        self._levels = []
+        width = self._width()
+        self._layout_width = width
+        pitch = self._cell + self._gap
+        has_groups = any(group is not None for group in self._groups)
+        left = self._label_width if has_groups else 0
+        columns = max(1, (width - left) // pitch)
+
+        row = -1
+        column = columns
+        current_group = object()
+        for idx, group in enumerate(self._groups):
+            if group != current_group or column >= columns:
+                if group != current_group and row >= 0 and has_groups:
+                    # Espaço extra entre grupos
+                    row += 0.5
+                row += 1
+                column = 0
+                if group != current_group and has_groups:
+                    self.canvas.create_text(2, row * pitch + self._cell / 2, anchor='w', fill="#ffffff",
+                                            text=str(group))
+                current_group = group
+            x = left + column * pitch
+            y = row * pitch
+            level = self._level(self._values[idx])
+            self._items.append(self.canvas.create_rectangle(x, y, x + self._cell, y + self._cell,
+                                                            fill=self._palette[level], outline='',
+                                                            tags=('cell', f'cell{idx}')))
+            self._levels.append(level)
+            column += 1
+
+        height = int((row + 1) * pitch) if self._items else self._cell
+        if int(self.canvas.cget('height')) != height:
+            self.canvas.configure(height=height)
+
+    def _on_resize(self):
+        """
+        Refaz o layout se a largura mudou (mudanças só de altura vêm do próprio layout).
+        """
+        if self._width() != self._layout_width and self._names:
+            self._layout()
+
+    def _on_motion(self, event):
+        """
+        Mostra o nome e o valor da célula sob o ponteiro.
+        """
+        items = self.canvas.find_overlapping(event.x, event.y, event.x, event.y)
+        cells = [item for item in items if 'cell' in self.canvas.gettags(item)]
+        if not cells:
+            self._hide_tooltip()
+            return
+        idx = self._items.index(cells[0])
+        text = f"{self._names[idx]}  {self._values[idx]:.1f}%"
+        if self._tooltip is None:
+            self._tooltip = self.canvas.create_text(0, 0, anchor='sw', fill="#ffffff", text="")
+        x = min(event.x + 8, max(self._width() - 90, 0))
+        self.canvas.coords(self._tooltip, x, max(event.y - 4, 12))
+        self.canvas.itemconfigure(self._tooltip, text=text)
+        self.canvas.tag_raise(self._tooltip)
+
+    def _hide_tooltip(self):
+        """
+        Esconde o texto de nome/valor da célula.
+        """
+        if self._tooltip is not None:
+            self.canvas.delete(self._tooltip)
+            self._tooltip = None
+
+    def _level(self, value):
+        """
+        Converte um valor (0-100) na faixa de cor correspondente.
+        """
+        return min(max(int(round(value / 100.0 * self._LEVELS)), 0), self._LEVELS)
+
+    def _color(self, ratio):
+        """
+        Cor de uma faixa: de cinza escuro (ocioso) passando por verde e amarelo até vermelho (100%).
+        """
+        stops = [(0.0, (0x33, 0x33, 0x33)), (0.25, (0x00, 0xbc, 0x8c)), (0.6, (0xf3, 0x9c, 0x12)),
+                 (1.0, (0xe7, 0x4c, 0x3c))]
+        for (r1, c1), (r2, c2) in zip(stops, stops[1:]):
+            if ratio <= r2:
+                t = (ratio - r1) / (r2 - r1)
+                return "#%02x%02x%02x" % tuple(int(a + (b - a) * t) for a, b in zip(c1, c2))
+        return "#%02x%02x%02x" % stops[-1][1]
+
+    def _width(self):
+        """
+        Largura atual do canvas (antes de ser mapeado, usa a largura configurada).
+        """
+        width = self.canvas.winfo_width()
+        return width if width > 1 else int(self.canvas.cget('width'))
@@ -1,5 +1,96 @@
-from controller import Controller
+import time
+_start = time.perf_counter()
+
+import argparse
+
+def parse_uid_range(text):
+    """
+    Converte "MIN-MAX" em (MIN, MAX) para --scope-uid-range.
+    """
+    low, sep, high = text.partition("-")
+    if not sep:
+        raise ValueError(text)
+    return (int(low), int(high))
 
 if __name__ == "__main__":
-    controller = Controller()
+    parser = argparse.ArgumentParser(description="Operating System Dashboard")
+    parser.add_argument("--separate-process", action="store_true",
+                        help="roda os coletores em um processo filho (snapshots em memória compartilhada)")
+    parser.add_argument("--smaps-interval", type=float, default=5,
+                        help="intervalo mínimo (s) entre leituras de smaps_rollup do mesmo processo")
+    parser.add_argument("--smaps-budget", type=float, default=0.05,
+                        help="tempo máximo (s) gasto lendo smaps_rollup por coleta")
+    parser.add_argument("--hot-threads-top-n", type=int, default=30,
+                        help="quantas threads (as de maior uso de CPU no sistema) a aba Hot Threads mostra")
+    parser.add_argument("--hot-threads-budget", type=float, default=0.02,
+                        help="fração de uma CPU que a varredura de hot threads pode usar (ajusta o intervalo)")
+    parser.add_argument("--short-lived-interval", type=float, default=0.05,
+                        help="intervalo (s) da checagem de nascimentos de processos (aba Recently Exited)")
+    parser.add_argument("--pressure-interval", type=float, default=0.5,
+                        help="intervalo (s) da coleta do pressure stall information (PSI) do sistema")
+    parser.add_argument("--numa-interval", type=float, default=10,
+                        help="intervalo mínimo (s) entre leituras de numa_maps do mesmo processo")
+    parser.add_argument("--numa-budget", type=float, default=0.05,
+                        help="tempo máximo (s) gasto lendo numa_maps por coleta")
+    parser.add_argument("--growth-interval", type=float, default=10,
+                        help="intervalo (s) entre amostras de RSS do detector de crescimento de memória")
+    parser.add_argument("--growth-window", type=int, default=30,
+                        help="quantas amostras de RSS por processo o detector de crescimento guarda")
+    parser.add_argument("--scope-user", action="append", default=[],
+                        help="coleta só processos deste usuário (nome ou UID; pode ser repetido)")
+    parser.add_argument("--scope-uid-range", type=parse_uid_range,
+                        default=None, metavar="MIN-MAX",
+                        help="coleta só processos com UID nesta faixa (inclusiva), ex.: 1000-60000")
+    parser.add_argument("--scope-cgroup", default=None,
+                        help="coleta só processos deste cgroup v2 (ou de descendentes), ex.: /system.slice")
+    parser.add_argument("--scope-name", default=None,
+                        help="coleta só processos cujo nome (comm) casa com esta regex")
+    parser.add_argument("--exclude-kernel-threads", action="store_true",
+                        help="não coleta threads do kernel (flag PF_KTHREAD)")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="porta local do endpoint OpenMetrics (/metrics); desabilitado se omitido")
+    parser.add_argument("--metrics-top-n", type=int, default=50,
+                        help="quantos processos (top por CPU e por RSS) são exportados")
+    parser.add_argument("--web-port", type=int, default=None,
+                        help="em vez da janela Tk, serve o dashboard no navegador em http://127.0.0.1:PORTA/")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="imprime o tempo de imports, janela desenhada e primeiros dados reais")
+    args = parser.parse_args()
+
+    # Valida os filtros de escopo aqui: um erro dentro do Model (ou do processo coletor) só deixaria a UI vazia
+    if args.scope_user:
+        from model import ScopeFilter
+        unknown = ScopeFilter.resolve_users(args.scope_user)[1]
+        if unknown:
+            parser.error(f"--scope-user: usuário desconhecido: {', '.join(unknown)}")
+    if args.scope_name:
+        import re
+        try:
+            re.compile(args.scope_name)
+        except re.error as error:
+            parser.error(f"--scope-name: regex inválida: {error}")
+
+    model_options = {"smaps_interval": args.smaps_interval, "smaps_budget": args.smaps_budget,
+                     "hot_threads_top_n": args.hot_threads_top_n, "hot_threads_budget": args.hot_threads_budget,
+                     "short_lived_interval": args.short_lived_interval,
+                     "pressure_interval": args.pressure_interval,
+                     "numa_interval": args.numa_interval, "numa_budget": args.numa_budget,
+                     "growth_interval": args.growth_interval, "growth_window": args.growth_window,
+                     "scope_users": args.scope_user, "scope_uid_range": args.scope_uid_range,
+                     "scope_cgroup": args.scope_cgroup, "scope_name": args.scope_name,
+                     "exclude_kernel_threads": args.exclude_kernel_threads}
+    if args.web_port:
+        # Frontend web: não importa o Tk (pode rodar em servidores sem sessão gráfica)
+        if args.separate_process:
+            parser.error("--separate-process não é suportado com --web-port (o servidor web já roda fora da UI)")
+        from web import WebDashboard
+        WebDashboard(port=args.web_port, model_options=model_options, metrics_port=args.metrics_port,
+                     metrics_top_n=args.metrics_top_n).run()
+        raise SystemExit
+
+    from controller import Controller
+    startup_times = {"start": _start, "imports": time.perf_counter()} if args.startup_report else None
+    controller = Controller(separate_process=args.separate_process, model_options=model_options,
+                            metrics_port=args.metrics_port, metrics_top_n=args.metrics_top_n,
+                            startup_times=startup_times)
     controller.run()
\ No newline at end of file
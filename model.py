@@ -1,5 +1,10 @@
 from ctypes import CDLL, Structure, c_char, c_char_p, c_int, c_void_p, c_ulonglong, c_ushort, c_ubyte, POINTER
 from ctypes.util import find_library
+from collections import deque
+import heapq
+import os
+import pwd
+import re
 import threading
 import time
 
@@ -57,6 +62,144 @@ class CtypesFunctions:
             self.closedir(dir_ptr)
         return entries
 
+    def list_subdirectories(self, path):
+        """
+        Listar apenas os subdiretórios de um diretório (usando o d_type da entrada, sem stat adicional).
+        """
+        DT_DIR = 4
+        entries = []
+        dir_ptr = self.opendir(path.encode("utf-8"))
+        if not dir_ptr:
+            return []
+        try:
+            while True:
+                entry_ptr = self.readdir(dir_ptr)
+                if not entry_ptr:
+                    break
+                entry = entry_ptr.contents
+                if entry.d_type != DT_DIR:
+                    continue
+                name_bytes = bytes(entry.d_name)
+                null_pos = name_bytes.find(b'\x00')
+                if null_pos != -1:
+                    name_bytes = name_bytes[:null_pos]
+                name = name_bytes.decode("utf-8", errors="replace")
+                if name not in (".", ".."):
+                    entries.append(name)
+        finally:
+            self.closedir(dir_ptr)
+        return entries
+
+
+class CostAwareSampler:
+    """
+    Classe CostAwareSampler para amostrar arquivos caros de ler por processo (ex.: /proc/<pid>/smaps_rollup).
+    Cada PID é relido no máximo a cada `interval` segundos e cada chamada de sample() respeita um orçamento de tempo;
+    os PIDs que não couberem no orçamento ficam para o próximo tick. Os resultados ficam em cache entre amostras.
+    """
+    def __init__(self, reader, interval=5, budget=0.05):
+        self._reader = reader       # Função pid -> valor (ou None se não for possível ler)
+        self._interval = interval   # Intervalo mínimo entre leituras do mesmo PID (em segundos)
+        self._budget = budget       # Tempo máximo gasto por chamada de sample() (em segundos)
+        self._cache = {}            # {pid: (valor, instante da leitura)}
+
+    def sample(self, candidates):
+        """
+        Lê os PIDs vencidos, na ordem de prioridade de candidates, até o orçamento acabar.
+        Return: Número de PIDs lidos
+        """
+        start = time.perf_counter()
+        now = time.time()
+        sampled = 0
+        for pid in candidates:
+            if time.perf_counter() - start >= self._budget:
+                break
+            entry = self._cache.get(pid)
+            if entry and now - entry[1] < self._interval:
+                continue
+            self._cache[pid] = (self._reader(pid), now)
+            sampled += 1
+        return sampled
+
+    def get(self, pid):
+        """
+        Retorna o último valor lido para o PID (None se ainda não foi amostrado).
+        """
+        entry = self._cache.get(pid)
+        return entry[0] if entry else None
+
+    def prune(self, alive_pids):
+        """
+        Descarta do cache os PIDs que não existem mais.
+        """
+        for pid in self._cache.keys() - alive_pids:
+            del self._cache[pid]
+
+
+class ScopeFilter:
+    """
+    Classe ScopeFilter para restringir a coleta a um subconjunto dos processos (usuários, faixa de UIDs, cgroup,
+    nome, sem threads do kernel). Cada critério é aplicado no estágio mais barato possível da varredura:
+    - usuário/UID: dono do diretório /proc/<pid> (um stat, sem abrir nenhum arquivo). O dono é o UID efetivo;
+      processos não-dumpable (ex.: setuid) aparecem como do root;
+    - threads do kernel (flag PF_KTHREAD) e nome (regex no comm): campos do stat, antes de ler statm, status, io...;
+    - cgroup: /proc/<pid>/cgroup (com cache no Model), só para quem passou pelos critérios anteriores.
+    """
+    PF_KTHREAD = 0x00200000     # Flag do kernel (campo 9 do stat) das threads do kernel
+
+    def __init__(self, users=(), uid_range=None, cgroup=None, name=None, exclude_kernel_threads=False):
+        self._uids = self.resolve_users(users)[0] if users else None    # UIDs permitidos (None: qualquer)
+        self._uid_range = uid_range     # (mínimo, máximo), inclusivo
+        self._cgroup = (cgroup.rstrip("/") or "/") if cgroup else None
+        self._name = re.compile(name) if name else None
+        self._exclude_kernel_threads = exclude_kernel_threads
+        self.checks_owner = self._uids is not None or uid_range is not None
+        self.checks_cgroup = self._cgroup is not None
+        self.active = self.checks_owner or self.checks_cgroup or self._name is not None or exclude_kernel_threads
+
+    @staticmethod
+    def resolve_users(users):
+        """
+        Converte nomes de usuário (ou UIDs numéricos) em UIDs (pela base de usuários do sistema, inclusive NSS).
+        Return: Tuple (set de UIDs, [nomes desconhecidos])
+        """
+        uids = set()
+        unknown = []
+        for user in users:
+            user = str(user)
+            if user.isdigit():
+                uids.add(int(user))
+                continue
+            try:
+                uids.add(pwd.getpwnam(user).pw_uid)
+            except KeyError:
+                unknown.append(user)
+        return uids, unknown
+
+    def match_owner(self, uid):
+        """
+        Checa o dono do processo (UID do diretório /proc/<pid>).
+        """
+        if self._uids is not None and uid not in self._uids:
+            return False
+        return self._uid_range is None or self._uid_range[0] <= uid <= self._uid_range[1]
+
+    def match_stat(self, data):
+        """
+        Checa os campos do stat (ver Model._parse_stat): flags do kernel e nome.
+        """
+        if self._exclude_kernel_threads and int(data[8]) & self.PF_KTHREAD:
+            return False
+        return self._name is None or self._name.search(data[1]) is not None
+
+    def match_cgroup(self, path):
+        """
+        Checa se o cgroup do processo é o cgroup do filtro ou um descendente dele.
+        """
+        if path is None:
+            return False
+        return self._cgroup == "/" or path == self._cgroup or path.startswith(self._cgroup + "/")
+
 
 class Model:
     """
@@ -64,7 +207,13 @@ class Model:
     Ela coleta informações de processos, informações de processos específicos e estatísticas gerais.
     Threads separados são usados para coletar dados continuamente e se comunicar com a thread principal.
     """
-    def __init__(self, process_queue, specific_processes_queue, specific_processes_req_queue, general_stats_queue, DT=1):
+    def __init__(self, process_queue, specific_processes_queue, specific_processes_req_queue, general_stats_queue,
+                 cgroups_queue=None, hot_threads_queue=None, short_lived_queue=None, pressure_queue=None, DT=1,
+                 smaps_interval=5, smaps_budget=0.05, smaps_top_n=50, status_top_n=50, warm_up=0.25,
+                 hot_threads_top_n=30, hot_threads_budget=0.02, short_lived_interval=0.05, short_lived_window=60,
+                 pressure_interval=0.5, numa_interval=10, numa_budget=0.05, numa_top_n=10,
+                 growth_interval=10, growth_window=30, scope_users=(), scope_uid_range=None, scope_cgroup=None,
+                 scope_name=None, exclude_kernel_threads=False):
         self.ctypes_functions = CtypesFunctions()
         # Threading
         self._processes_thread_running = False
@@ -73,25 +222,130 @@ class Model:
         self._specific_processes_thread = None
         self._general_stats_thread_running = False
         self._general_stats_thread = None
+        self._cgroups_thread_running = False
+        self._cgroups_thread = None
+        self._hot_threads_thread_running = False
+        self._hot_threads_thread = None
+        self._short_lived_thread_running = False
+        self._short_lived_thread = None
+        self._pressure_thread_running = False
+        self._pressure_thread = None
 
         # Queues (para comunicação com a thread principal)
         self.process_queue = process_queue
         self.specific_processes_queue = specific_processes_queue
         self.specific_processes_req_queue = specific_processes_req_queue
         self.general_stats_queue = general_stats_queue
+        self.cgroups_queue = cgroups_queue
+        self.hot_threads_queue = hot_threads_queue
+        self.short_lived_queue = short_lived_queue
+        self.pressure_queue = pressure_queue
 
         # Guardam dados coletados
         self._processes_dict = {}
         self._specific_processes_dict = {}
         self._general_stats_list = []
+        self._cgroups_list = []
 
         # Calculo de uso de CPU
         self._CLK_TCK_PS = 100  # Default value for clock ticks per second in Linux
+        self._PAGE_SIZE_KB = os.sysconf("SC_PAGE_SIZE") // 1024
         self._prev_proc_data = {}
         self._prev_thrd_data = {}
+        # Contadores de escalonamento por thread {tid: ((run_ns, wait_ns, timeslices, voluntary, involuntary), tempo)}
+        self._prev_sched_data = {}
+        # Calculo de taxas de I/O (bytes/s) {id: (contadores, tempo)}
+        self._prev_io_data = {}
+        self._prev_disk_data = {}
+        self._prev_net_data = {}
+        self._prev_cgroup_data = {}
+        # Tempo total de stall do PSI {recurso: ((some_total, full_total), tempo)} do sistema (thread de PSI) e
+        # {(cgroup, recurso): ...} dos cgroups (thread de cgroups), separados para cada thread só tocar no seu
+        self._prev_pressure_data = {}
+        self._prev_cgroup_pressure_data = {}
+        self._PRESSURE_INTERVAL = pressure_interval     # Intervalo da coleta do PSI do sistema (em segundos)
+        # Tempos de CPU do sistema {cpu: ((idle, total), tempo)}, para o uso de CPU por delta
+        self._prev_cpu_data = {}
+        # Topologia das CPUs lógicas {cpu: (socket, nó NUMA)}, não muda durante a execução
+        self._cpu_topology = self._get_cpu_topology()
+        # NUMA: nós de memória, contadores do numastat {nó: ((local_node, other_node), tempo)} e placement por
+        # processo (/proc/<pid>/numa_maps, caro: amostrado só para abas abertas e maiores RSS, se houver mais de um nó)
+        self._numa_nodes = sorted(int(entry[4:]) for entry in self.ctypes_functions.list_directory("/sys/devices/system/node")
+                                  if entry.startswith("node") and entry[4:].isdigit())
+        self._prev_numa_data = {}
+        self._numa_sampler = CostAwareSampler(self._read_numa_maps, numa_interval, numa_budget)
+        self._NUMA_TOP_N = numa_top_n       # Quantos processos (maior RSS) têm o placement amostrado e exibido
+
+        # Descritores de arquivo: cache {pid: (starttime, tamanho de /proc/<pid>/fd, nº de FDs, [inodes de sockets],
+        # instante da listagem, sockets achados no índice)} e totais de sockets do sistema da última coleta
+        # (ver _build_socket_index)
+        self._fd_cache = {}
+        self._FD_REFRESH = 5    # Relista o diretório após esse tempo se houver sockets ou o kernel não informar a contagem
+        self._socket_totals = ()
+
+        # Detector de crescimento de memória: janela de RSS (KB) por processo {pid: (starttime, deque)}, alinhada
+        # ao fim dos instantes das amostras (_growth_times), e o último resultado {pid: (slope, tempo até esgotar)}
+        self._rss_history = {}
+        self._growth_times = deque(maxlen=growth_window)
+        self._growth = {}
+        self._last_growth_sample = 0
+        self._GROWTH_INTERVAL = growth_interval     # Intervalo entre amostras de RSS da janela (em segundos)
+        self._GROWTH_MIN_SAMPLES = max(growth_window // 2, 4)   # Amostras mínimas para estimar a tendência
+        self._GROWTH_MIN_KB = 1024          # Crescimento mínimo na janela (e pelo menos 5% do RSS) para sinalizar
+
+        # cgroup v2: raiz da hierarquia unificada (None se não houver) e cache {pid: (cgroup, instante da leitura)}
+        self._cgroup_root = self._find_cgroup2_root()
+        self._pid_cgroup_cache = {}
+        self._PID_CGROUP_TTL = 30   # Relê /proc/<pid>/cgroup após esse tempo (processos podem migrar)
+
+        # Escopo da coleta (filtros aplicados antes das leituras caras) e todos os PIDs vistos na última varredura
+        # (inclusive os fora do escopo, para o cache de cgroups não ser descartado e relido a cada coleta)
+        self._scope = ScopeFilter(scope_users, scope_uid_range, scope_cgroup, scope_name, exclude_kernel_threads)
+        self._scan_pids = set()
 
         # Intervalo de tempo entre coletas (em segundos)
         self._DT = DT
+        # Intervalo entre a coleta inicial (priming) e a primeira coleta publicada (em segundos)
+        self._WARM_UP = warm_up
+
+        # Memória detalhada (PSS, USS, swap) de /proc/<pid>/smaps_rollup, amostrada em cadência mais lenta
+        self._smaps_sampler = CostAwareSampler(self._read_smaps_rollup, smaps_interval, smaps_budget)
+        self._SMAPS_TOP_N = smaps_top_n     # Quantos processos com maior RSS têm prioridade na amostragem
+        # PIDs visíveis na lista de processos da View (prioridade na amostragem)
+        self._visible_pids = set()
+
+        # Coleta em duas fases: cache do que só o status fornece {pid: (starttime, username)}
+        self._status_cache = {}
+        self._STATUS_TOP_N = status_top_n   # Top-N por CPU e por RSS que sempre releem o status
+        self._last_scan_reads = (0, 0)      # (leituras de stat, leituras de status) na última coleta
+        self._usernames = {}                # Cache {uid: username}
+        # Última amostra da coleta principal, reaproveitada pelo coletor de detalhes
+        # {pid: (campos do stat, cpu_usage, rss_kb, (read_rate, write_rate, syscr_rate, syscw_rate), status ou None)}
+        self._scan_snapshot = {}
+        self._cmdline_cache = {}            # {pid: (starttime, command)}
+
+        # Hot threads: {pid: (starttime, ticks do processo, {tid: ticks}, ticks vindos do stat do processo)} da última
+        # varredura e instante dela
+        self._prev_hot_threads = {}
+        self._hot_threads_time = None
+        self._HOT_THREADS_TOP_N = hot_threads_top_n
+        self._HOT_THREADS_BUDGET = hot_threads_budget   # Fração de uma CPU que a varredura pode usar
+
+        # Processos de vida curta: último PID alocado e total de forks (/proc/loadavg e /proc/stat) na última checagem,
+        # processos nascidos recentemente {pid: (starttime, nome, ticks de CPU)} e saídas [(instante, nome, ticks)]
+        self._last_pid = None
+        self._total_forks = None
+        self._forks_history = deque()       # [(instante, forks, forks não vistos)] dentro da janela
+        self._newborns = {}
+        self._exits = deque()
+        self._SHORT_LIVED_INTERVAL = short_lived_interval  # Intervalo da checagem de nascimentos (em segundos)
+        self._SHORT_LIVED_WINDOW = short_lived_window      # Janela do resumo de processos encerrados (em segundos)
+        self._SHORT_LIVED_MAX_SCAN = 4096   # Máximo de PIDs novos lidos por checagem (os mais recentes)
+        try:
+            with open("/proc/sys/kernel/pid_max", "r") as f:
+                self._PID_MAX = int(f.read())
+        except (OSError, ValueError):
+            self._PID_MAX = 32768
 
     ################################################
     # Metodos de inicialização e parada de threads #
@@ -139,6 +393,66 @@ class Model:
         if self._general_stats_thread:
             self._general_stats_thread.join()
 
+    def start_cgroups_thread(self):
+        """
+        Inicia a thread para listar dados agregados por cgroup (containers / slices).
+        """
+        self._cgroups_thread_running = True
+        self._cgroups_thread = threading.Thread(target=self._list_cgroups, daemon=True)
+        self._cgroups_thread.start()
+    def stop_cgroups_thread(self):
+        """
+        Encerra a thread para listar dados agregados por cgroup.
+        """
+        self._cgroups_thread_running = False
+        if self._cgroups_thread:
+            self._cgroups_thread.join()
+
+    def start_hot_threads_thread(self):
+        """
+        Inicia a thread para ranquear as threads do sistema por uso de CPU.
+        """
+        self._hot_threads_thread_running = True
+        self._hot_threads_thread = threading.Thread(target=self._list_hot_threads, daemon=True)
+        self._hot_threads_thread.start()
+    def stop_hot_threads_thread(self):
+        """
+        Encerra a thread de hot threads.
+        """
+        self._hot_threads_thread_running = False
+        if self._hot_threads_thread:
+            self._hot_threads_thread.join()
+
+    def start_short_lived_thread(self):
+        """
+        Inicia a thread que acompanha nascimentos de processos (captura processos de vida curta).
+        """
+        self._short_lived_thread_running = True
+        self._short_lived_thread = threading.Thread(target=self._list_short_lived, daemon=True)
+        self._short_lived_thread.start()
+    def stop_short_lived_thread(self):
+        """
+        Encerra a thread de processos de vida curta.
+        """
+        self._short_lived_thread_running = False
+        if self._short_lived_thread:
+            self._short_lived_thread.join()
+
+    def start_pressure_thread(self):
+        """
+        Inicia a thread para coletar o pressure stall information (PSI) do sistema.
+        """
+        self._pressure_thread_running = True
+        self._pressure_thread = threading.Thread(target=self._list_pressure, daemon=True)
+        self._pressure_thread.start()
+    def stop_pressure_thread(self):
+        """
+        Encerra a thread do PSI.
+        """
+        self._pressure_thread_running = False
+        if self._pressure_thread:
+            self._pressure_thread.join()
+
     ###################################################
     # Metodos de coleta de dados em threads separadas #
     ###################################################
@@ -147,6 +461,7 @@ class Model:
         Rodando na thread _list_processes_thread.
         Coleta dados gerais sobre todos os processos do sistema.
         """
+        self._prime(self._get_processes_data)
         while self._processes_thread_running:
             self.process_queue.put(self._get_processes_data())
             time.sleep(self._DT)
@@ -170,6 +485,9 @@ class Model:
                         del self._specific_processes_dict[pid]
                     except KeyError:
                         pass
+                elif req == 'visible':
+                    # Nesse caso "pid" é a lista de PIDs visíveis na lista de processos
+                    self._visible_pids = set(pid)
 
             # Retorna os dados dos processos específicos monitorados
             self.specific_processes_queue.put(self._get_specific_processes_data())
@@ -180,152 +498,524 @@ class Model:
         Rodando na thread _list_general_stats_thread.
         Coleta estatísticas gerais do sistema, como uso de memória, CPU, carga média, etc.
         """
+        self._prime(self._get_general_stats_data)
         while self._general_stats_thread_running:
             self.general_stats_queue.put(self._get_general_stats_data())
             time.sleep(self._DT)
 
+    def _list_cgroups(self):
+        """
+        Rodando na thread _cgroups_thread.
+        Coleta uso de CPU, memória e I/O de cada cgroup (lidos direto de /sys/fs/cgroup) e os PIDs membros.
+        """
+        self._prime(self._get_cgroups_data)
+        while self._cgroups_thread_running:
+            self.cgroups_queue.put(self._get_cgroups_data())
+            time.sleep(self._DT)
+
+    def _list_hot_threads(self):
+        """
+        Rodando na thread _hot_threads_thread.
+        Ranqueia as threads de todo o sistema por uso de CPU. O intervalo é adaptativo: cresce com o custo da
+        varredura para que ela não passe de _HOT_THREADS_BUDGET de uma CPU (entre DT e 10 * DT).
+        """
+        self._prime(self._get_hot_threads_data)
+        while self._hot_threads_thread_running:
+            threads, scanned, cost = self._get_hot_threads_data()
+            interval = min(max(self._DT, cost / self._HOT_THREADS_BUDGET), 10 * self._DT)
+            self.hot_threads_queue.put((threads, scanned, cost, interval))
+            # Dorme em passos de DT para não atrasar o encerramento da thread
+            deadline = time.time() + interval
+            while self._hot_threads_thread_running and time.time() < deadline:
+                time.sleep(min(self._DT, max(deadline - time.time(), 0)))
+
+    def _list_short_lived(self):
+        """
+        Rodando na thread _short_lived_thread.
+        Checa nascimentos de processos em alta frequência (_SHORT_LIVED_INTERVAL) e publica, a cada DT, o resumo dos
+        processos de vida curta encerrados na janela recente.
+        """
+        next_publish = time.time() + self._DT
+        while self._short_lived_thread_running:
+            self._track_births()
+            if time.time() >= next_publish:
+                self.short_lived_queue.put(self._get_short_lived_data())
+                next_publish = time.time() + self._DT
+            time.sleep(self._SHORT_LIVED_INTERVAL)
+
+    def _list_pressure(self):
+        """
+        Rodando na thread _pressure_thread.
+        Coleta o PSI do sistema em intervalo próprio, que pode ser menor que DT (só três arquivos pequenos são lidos).
+        """
+        self._prime(self._get_pressure_data)
+        while self._pressure_thread_running:
+            self.pressure_queue.put(self._get_pressure_data())
+            time.sleep(self._PRESSURE_INTERVAL)
+
+    def _prime(self, collect):
+        """
+        Faz uma coleta inicial, que não é publicada, só para que as taxas calculadas por delta (CPU, I/O) já tenham
+        uma medição anterior. Depois espera um aquecimento curto (em vez de um DT inteiro) antes da primeira
+        coleta publicada, que então já tem valores reais.
+        """
+        collect()
+        time.sleep(min(self._WARM_UP, self._DT))
+
     def _get_processes_data(self):
         """
-        Lista todos os processos do sistema e coleta dados gerais sobre eles.
-        Return: Dictionary {pid: (pid, name, user, priority, memory, cpu_usage, status)}
+        Lista todos os processos do sistema (dentro do escopo, ver ScopeFilter) e coleta dados gerais sobre eles,
+        em duas fases:
+        1. stat e statm de todos os processos (nome, estado, prioridade, CPU e memória);
+        2. status só dos processos com aba aberta, visíveis na View, top-N por CPU/RSS, novos ou sem UID em cache.
+        Return: Dictionary {pid: (pid, name, user, priority, memory, cpu_usage, status, read_rate, write_rate,
+                pss, uss, swap, rss_kb, fd_count, sockets, growth)}
+                fd_count e sockets: ver _get_fd_data ("N/A" e () se o diretório de FDs não puder ser lido)
+                growth: (slope em KB/s, segundos até esgotar a memória ou o limite do cgroup, ou None) se o processo
+                        tem crescimento sustentado de RSS, ou () (ver _get_growth_data)
         """
-        self._processes_dict = {}
-        # Lista os diretórios em /proc
+        # Monta em um dict local e só publica no fim (outras threads leem self._processes_dict)
+        processes_dict = {}
+        rss_kb = {}     # RSS numérico de cada processo (prioriza smaps_rollup e a fase 2)
+        stat_data = {}  # Campos do stat de cada processo
+        cpu_usages = {}
+        scope = self._scope
+        scan_pids = set()
+        # Fase 1: stat + statm de todos os processos
         entries = self.ctypes_functions.list_directory("/proc")
         for entry in entries:
             if entry.isdigit(): # Checa se a entrada é um número (PID)
                 try:
                     pid = int(entry)
-                    name = "N/A"
-                    status = "N/A"
-                    memory = "N/A"
-                    username = "N/A"
-                    cpu_usage = 0.0
-                    priority = 0
+                    scan_pids.add(pid)
+                    # Filtros de escopo, do mais barato ao mais caro (dono do diretório, stat, cgroup)
+                    if scope.checks_owner and not scope.match_owner(os.stat(f"/proc/{entry}").st_uid):
+                        continue
+                    with open(f"/proc/{entry}/stat", "r") as f:
+                        data = self._parse_stat(f.read())
+                    if not scope.match_stat(data):
+                        continue
+                    if scope.checks_cgroup and not scope.match_cgroup(self._get_pid_cgroup(pid)):
+                        continue
+                    with open(f"/proc/{entry}/statm", "r") as f:
+                        rss_kb[pid] = int(f.read().split()[1]) * self._PAGE_SIZE_KB    # Páginas residentes
+                    total_time = int(data[13]) + int(data[14])
+                    cpu_usages[pid] = self._get_cpu_usage_process(pid, total_time)   # Uso de CPU em porcentagem
+                    stat_data[pid] = data
+                except:
+                    # Processo foi encerrado, não será incluído
+                    continue
 
-                    with open(f"/proc/{entry}/status", "r") as f:
+        # Fase 2: status só para quem precisa
+        status_pids = set(list(self._specific_processes_dict)) | self._visible_pids
+        status_pids.update(sorted(cpu_usages, key=cpu_usages.get, reverse=True)[:self._STATUS_TOP_N])
+        status_pids.update(sorted(rss_kb, key=rss_kb.get, reverse=True)[:self._STATUS_TOP_N])
+        for pid, data in stat_data.items():
+            cached = self._status_cache.get(pid)
+            if not cached or cached[0] != data[21]:     # Novo processo (ou PID reutilizado: starttime diferente)
+                status_pids.add(pid)
+        status_reads = 0
+        status_fields = {}  # Status completo dos processos com aba aberta (reaproveitado pelo coletor de detalhes)
+        specific_pids = set(list(self._specific_processes_dict))
+        for pid in status_pids & stat_data.keys():
+            try:
+                username = "N/A"
+                with open(f"/proc/{pid}/status", "r") as f:
+                    if pid in specific_pids:
+                        fields = dict(line.split(":", 1) for line in f if ":" in line)
+                        status_fields[pid] = fields
+                        username = self._uid_to_username(fields["Uid"].split()[0])
+                    else:
                         for line in f:
-                            if line.startswith("Name:"):
-                                name = line.split(":")[1].strip()   # Nome do processo
-                            elif line.startswith("State:"):
-                                status = line.split(":")[1].strip().split()[0]
-                                status = self._get_process_status(status)   # Status do processo
-                            elif line.startswith("VmRSS:"):
-                                memory = line.split(":")[1].strip().split()[0]
-                                memory = self._kb_to_mb_gb(int(memory))    # Uso de memória (RSS) em MB ou KB
-                            elif line.startswith("Uid:"):
+                            if line.startswith("Uid:"):
                                 userid = line.split(":")[1].split()[0]
                                 username = self._uid_to_username(userid)    # Username (do UID)
+                                break
+                self._status_cache[pid] = (stat_data[pid][21], username)
+                status_reads += 1
+            except (OSError, KeyError):
+                continue
+        self._last_scan_reads = (len(stat_data), status_reads)
+        self._scan_pids = scan_pids
+        scan_snapshot = {}
 
-                    with open(f"/proc/{entry}/stat", "r") as f:
-                        data = f.read().split()
-                        priority = int(data[17])    # Prioridade do processo (no kernel)
-                        total_time = int(data[13]) + int(data[14])
-                        cpu_usage = self._get_cpu_usage_process(int(entry), total_time)   # Uso de CPU em porcentagem
+        # Descritores de arquivo e sockets por estado
+        fd_data = self._get_fd_data(stat_data)
 
-                    # Adiciona os dados do processo ao dicionário
-                    self._processes_dict[pid] = (pid, name, username, priority, memory, cpu_usage, status)
-                except:
-                    # Processo foi encerrado, não será incluído
-                    continue
+        for pid, data in stat_data.items():
+            name = data[1]      # Nome do processo
+            status = self._get_process_status(data[2])     # Status do processo
+            priority = int(data[17])    # Prioridade do processo (no kernel)
+            memory = self._kb_to_mb_gb(rss_kb[pid]) if rss_kb[pid] else "N/A"     # Uso de memória (RSS) em MB ou KB
+            username = self._status_cache[pid][1] if pid in self._status_cache else "N/A"
+            io_rates = ("N/A", "N/A", "N/A", "N/A")
+
+            io_data = self._read_process_io(pid)
+            if io_data:
+                # Taxas de I/O em disco (MB/s) e de syscalls de leitura/escrita (por segundo)
+                read_rate, write_rate, syscr_rate, syscw_rate = self._get_rates(
+                    self._prev_io_data, pid, (io_data[4], io_data[5], io_data[2], io_data[3]))
+                io_rates = (read_rate / (1024 * 1024), write_rate / (1024 * 1024), syscr_rate, syscw_rate)
+            read_rate, write_rate = io_rates[0], io_rates[1]
+
+            # Amostra compartilhada com o coletor de detalhes (evita reler os mesmos arquivos)
+            scan_snapshot[pid] = (data, cpu_usages[pid], rss_kb[pid], io_rates, status_fields.get(pid))
+
+            # Adiciona os dados do processo ao dicionário
+            processes_dict[pid] = (pid, name, username, priority, memory, cpu_usages[pid], status,
+                                   read_rate, write_rate)
+
+        # Descarta dados de processos encerrados
+        for pid in self._prev_io_data.keys() - processes_dict.keys():
+            del self._prev_io_data[pid]
+        for pid in self._status_cache.keys() - processes_dict.keys():
+            del self._status_cache[pid]
+        for pid in self._fd_cache.keys() - processes_dict.keys():
+            del self._fd_cache[pid]
+        if scope.checks_cgroup:
+            for pid in self._pid_cgroup_cache.keys() - scan_pids:
+                # A thread de cgroups também poda este cache: a chave pode já ter sido removida
+                self._pid_cgroup_cache.pop(pid, None)
+
+        # Amostra smaps_rollup dentro do orçamento e completa as linhas com PSS, USS e swap (do cache)
+        # e com o RSS numérico (em KB, para ordenação e exportação)
+        self._sample_smaps(rss_kb)
+        self._sample_numa_maps(rss_kb)
+        growth = self._get_growth_data(stat_data, rss_kb)
+        for pid, process in processes_dict.items():
+            processes_dict[pid] = process + self._get_smaps_fields(pid) + (rss_kb.get(pid, 0),) + fd_data[pid] + \
+                                  (growth.get(pid, ()),)
+        self._scan_snapshot = scan_snapshot
+        self._processes_dict = processes_dict
         return self._processes_dict
+
+    def _get_growth_data(self, stat_data, rss_kb):
+        """
+        Detecta processos com crescimento sustentado de memória (vazamentos, crescimento descontrolado).
+        A cada _GROWTH_INTERVAL segundos acrescenta o RSS de cada processo à sua janela (processos encerrados ou com
+        PID reutilizado são descartados) e reavalia a tendência:
+        - descarta em O(1) quem não cresceu pelo menos _GROWTH_MIN_KB (e 5% do RSS) entre a primeira e a última
+          amostra, que é quase todo o sistema;
+        - para os restantes, o slope é a mediana das inclinações entre pares de amostras separados por meia janela
+          (robusta a picos isolados), e o crescimento só é sustentado se pelo menos 80% desses pares crescem;
+        - o tempo até esgotar usa a menor folga entre a memória disponível do sistema e os limites (memory.max) do
+          cgroup do processo e de seus ancestrais.
+        Return: Dictionary {pid: (slope em KB/s, segundos até esgotar ou None)} só dos processos sinalizados
+        """
+        now = time.time()
+        if now - self._last_growth_sample < self._GROWTH_INTERVAL:
+            return self._growth
+        self._last_growth_sample = now
+        self._growth_times.append(now)
+        window = self._growth_times.maxlen
+
+        for pid in self._rss_history.keys() - stat_data.keys():
+            del self._rss_history[pid]
+        candidates = []
+        for pid, data in stat_data.items():
+            entry = self._rss_history.get(pid)
+            if not entry or entry[0] != data[21]:
+                entry = (data[21], deque(maxlen=window))
+                self._rss_history[pid] = entry
+            samples = entry[1]
+            samples.append(rss_kb[pid])
+            if len(samples) >= self._GROWTH_MIN_SAMPLES and \
+               samples[-1] - samples[0] >= max(self._GROWTH_MIN_KB, samples[-1] // 20):
+                candidates.append(pid)
+
+        growth = {}
+        times = list(self._growth_times)
+        available_kb = None
+        for pid in candidates:
+            samples = list(self._rss_history[pid][1])
+            n = len(samples)
+            t = times[-n:]
+            half = n // 2
+            slopes = sorted((samples[i + half] - samples[i]) / (t[i + half] - t[i]) for i in range(n - half))
+            if sum(1 for slope in slopes if slope > 0) < 0.8 * len(slopes):
+                continue
+            slope = slopes[len(slopes) // 2]
+            if available_kb is None:
+                available_kb = self._get_available_memory()
+            headroom = available_kb
+            cgroup_headroom = self._get_cgroup_headroom(pid)
+            if cgroup_headroom is not None:
+                headroom = min(headroom, cgroup_headroom)
+            growth[pid] = (round(slope, 2), headroom / slope if headroom > 0 else 0)
+        self._growth = growth
+        return growth
+
+    def _get_available_memory(self):
+        """
+        Retorna a memória disponível do sistema (MemAvailable de /proc/meminfo), em KB.
+        """
+        try:
+            with open("/proc/meminfo", "r") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1])
+        except (OSError, ValueError):
+            pass
+        return 0
+
+    def _get_cgroup_headroom(self, pid):
+        """
+        Retorna quanto (em KB) o cgroup de um processo ainda pode crescer: a menor folga (memory.max - memory.current)
+        entre o cgroup e seus ancestrais com limite, ou None se nenhum tiver limite (ou sem cgroup v2).
+        """
+        if not self._cgroup_root:
+            return None
+        path = self._get_pid_cgroup(pid)
+        headroom = None
+        while path:
+            directory = self._cgroup_root + path.rstrip("/")
+            try:
+                with open(f"{directory}/memory.max", "r") as f:
+                    limit = f.read().strip()
+                if limit != "max":
+                    with open(f"{directory}/memory.current", "r") as f:
+                        free_kb = (int(limit) - int(f.read())) // 1024
+                    headroom = free_kb if headroom is None else min(headroom, free_kb)
+            except (OSError, ValueError):
+                pass
+            if path == "/":
+                break
+            path = path.rsplit("/", 1)[0] or "/"
+        return headroom
+
+    def _get_fd_data(self, stat_data):
+        """
+        Conta os descritores de arquivo e os sockets (por tipo/estado) de cada processo.
+        - O diretório /proc/<pid>/fd só é relistado (e os links lidos) se o número de FDs mudou: o kernel informa a
+          contagem no st_size do diretório, então basta um stat por processo. Processos com sockets (que podem trocar
+          uma conexão por outra sem mudar a contagem) e kernels que não informam a contagem (st_size 0) são relistados
+          a cada _FD_REFRESH segundos, e antes disso se algum socket da última listagem sumiu do índice.
+        - Os inodes de sockets de cada processo ficam em cache; o estado de cada um vem de um índice único
+          {inode: tipo} montado uma vez por coleta (compartilhado por todos os processos).
+        stat_data: Dictionary {pid: campos do stat} da coleta atual.
+        Return: Dictionary {pid: (fd_count, (tcp_established, tcp_listen, tcp_close_wait, tcp_other, udp, unix))}
+        """
+        fd_data = {}
+        index = None
+        now = time.time()
+        for pid, data in stat_data.items():
+            path = f"/proc/{pid}/fd"
+            try:
+                size = os.stat(path).st_size
+            except OSError:
+                fd_data[pid] = ("N/A", ())
+                continue
+            cached = self._fd_cache.get(pid)
+            if cached and cached[0] == data[21] and (not size or cached[1] == size) and \
+               ((size and not cached[3]) or now - cached[4] < self._FD_REFRESH):
+                fd_count, inodes = cached[2], cached[3]
+            else:
+                cached = None
+                if not os.access(path, os.R_OK):
+                    # Processo de outro usuário (sem permissão)
+                    fd_data[pid] = ("N/A", ())
+                    continue
+                fd_count, inodes = self._list_fds(path)
+
+            counts = [0, 0, 0, 0, 0, 0]
+            if inodes:
+                if index is None:
+                    index = self._build_socket_index()
+                for inode in inodes:
+                    kind = index.get(inode)
+                    if kind is not None:
+                        counts[kind] += 1
+                if cached and sum(counts) < cached[5]:
+                    # Algum socket da listagem em cache foi fechado (e pode ter sido trocado por outro): relista
+                    fd_count, inodes = self._list_fds(path)
+                    counts = [0, 0, 0, 0, 0, 0]
+                    for inode in inodes:
+                        kind = index.get(inode)
+                        if kind is not None:
+                            counts[kind] += 1
+                    cached = None
+            if not cached:
+                # Guarda também quantos sockets foram achados no índice (sockets de outros network namespaces não
+                # aparecem nele, então a comparação é com essa contagem, não com o total de inodes)
+                self._fd_cache[pid] = (data[21], size, fd_count, inodes, now, sum(counts))
+            fd_data[pid] = (fd_count, tuple(counts))
+        return fd_data
+
+    def _list_fds(self, path):
+        """
+        Lista o diretório de FDs de um processo.
+        Return: Tuple (número de FDs, [inodes dos sockets])
+        """
+        fd_count = 0
+        inodes = []
+        for name in self.ctypes_functions.list_directory(path):
+            fd_count += 1
+            try:
+                link = os.readlink(f"{path}/{name}")
+            except OSError:
+                continue
+            if link.startswith("socket:["):
+                inodes.append(int(link[8:-1]))
+        return fd_count, inodes
+
+    def _build_socket_index(self):
+        """
+        Monta o índice {inode: tipo} de todos os sockets do sistema a partir de /proc/net/{tcp,tcp6,udp,udp6,unix}.
+        Tipos: 0 TCP established, 1 TCP listen, 2 TCP close-wait, 3 outro estado TCP, 4 UDP, 5 Unix.
+        Só os campos de estado e inode de cada linha são separados (split limitado), para escalar a 100k+ sockets.
+        Também guarda os totais do sistema em _socket_totals, incluindo TIME_WAIT (sockets em TIME_WAIT não pertencem
+        mais a nenhum processo: inode 0).
+        Return: Dictionary {inode: tipo}
+        """
+        index = {}
+        totals = [0, 0, 0, 0, 0, 0, 0]     # Os 6 tipos acima + TCP time-wait
+        # Estados TCP (hexadecimal): 01 ESTABLISHED, 0A LISTEN, 08 CLOSE_WAIT, 06 TIME_WAIT
+        tcp_kinds = {b"01": 0, b"0A": 1, b"08": 2, b"06": 6}
+        for name in ("tcp", "tcp6", "udp", "udp6", "unix"):
+            try:
+                with open(f"/proc/net/{name}", "rb") as f:
+                    lines = f.read().splitlines()[1:]
+            except OSError:
+                continue
+            if name == "unix":
+                # "Num RefCount Protocol Flags Type St Inode Path"
+                for line in lines:
+                    fields = line.split(None, 7)
+                    if len(fields) > 6:
+                        index[int(fields[6])] = 5
+                totals[5] += len(lines)
+                continue
+            # "sl local_address rem_address st tx_queue:rx_queue tr:tm->when retrnsmt uid timeout inode ..."
+            for line in lines:
+                fields = line.split(None, 10)
+                if len(fields) < 10:
+                    continue
+                kind = 4 if name.startswith("udp") else tcp_kinds.get(fields[3], 3)
+                totals[kind] += 1
+                inode = int(fields[9])
+                if inode and kind != 6:
+                    index[inode] = kind
+        self._socket_totals = tuple(totals)
+        return index
+
+    def _parse_stat(self, content):
+        """
+        Separa os campos de /proc/<pid>/stat. O nome (campo 2) fica entre parênteses e pode conter espaços,
+        então é extraído pelo último ')'.
+        Return: List com os campos na mesma numeração do kernel (0 = pid, 1 = nome, 2 = estado, 13 = utime, ...)
+        """
+        start = content.find("(")
+        end = content.rfind(")")
+        return [content[:start].strip(), content[start + 1:end]] + content[end + 2:].split()
     
     def _get_specific_processes_data(self):
         """
         Lista processos específicos que estão sendo monitorados.
         Se um PID for adicionado ou removido da fila specific_processes_req_queue, ele será monitorado ou não.
+        Reaproveita a última amostra da coleta principal (stat, status, CPU e I/O); só lê o cmdline (com cache)
+        e o stat das threads.
         Return: Dictionary {pid: (pid, ppid, name, username, cpu_usage, status, num_threads, priority, nice, processor_time, command,
-                virtual_mem, resident_mem, shared_mem, textsize, datasize, stacksize, (threads))}
+                virtual_mem, resident_mem, shared_mem, textsize, datasize, stacksize, (threads),
+                read_rate, write_rate, syscr_rate, syscw_rate, pss, uss, swap, rss_kb, sched, numa_placement, files)}
+                sched: (last_cpu, run_rate, wait_rate, slices_rate, voluntary_rate, involuntary_rate, affinity),
+                       com as taxas somadas sobre as threads (ver _get_threads_data)
+                numa_placement: ((node, kb), ...) do último numa_maps amostrado, ou () se ainda não amostrado
+                files: (fd_count, sockets) da coleta principal (ver _get_fd_data)
         """
         # Limpa o dicionário de processos específicos antes de coletar novos dados
         pids = list(self._specific_processes_dict.keys())
         self._specific_processes_dict = {}
+        scan_snapshot = self._scan_snapshot
+        alive_tids = set()
 
         for pid in pids:
             try:
                 pid = int(pid)
-                ppid = -1
-                name = "N/A"
-                username = "N/A"
-                cpu_usage = 0.0
-                status = "N/A"
-                num_threads = 0
-                priority = 0
-                nice = 0
-                processor_time = "N/A"
-                command = "N/A"
-                virtual_mem = "N/A"
-                resident_mem = "N/A"
-                shared_mem = "N/A"
-                textsize = "N/A"
-                datasize = "N/A"
-                stacksize = "N/A"
-
-                with open(f"/proc/{pid}/cmdline", "r") as f:
-                    command = f.read().strip().replace('\x00', ' ')   # Linha de comando do processo
-                
-                with open(f"/proc/{pid}/status", "r") as f:
-                    for line in f:
-                        if line.startswith("Name:"):
-                            name = line.split(":")[1].strip()   # Nome do processo
-                        elif line.startswith("State:"):
-                            status = line.split(":")[1].strip().split()[0]
-                            status = self._get_process_status(status)   # Status do processo
-                        elif line.startswith("VmRSS:"):
-                            resident_mem = line.split(":")[1].strip().split()[0]
-                            resident_mem = self._kb_to_mb_gb(int(resident_mem))    # Memoria residente (RSS) em MB ou KB
-                        elif line.startswith("Uid:"):
-                            userid = line.split(":")[1].split()[0]
-                            username = self._uid_to_username(userid)    # Username (do UID)
-                        elif line.startswith("Threads:"):
-                            num_threads = line.split(":")[1].strip()
-                            num_threads = int(num_threads) if num_threads.isdigit() else 0  # Número de threads do processo
-                        elif line.startswith("VmSize:"):
-                            virtual_mem = line.split(":")[1].strip().split()[0]
-                            virtual_mem = self._kb_to_mb_gb(int(virtual_mem))    # Memória virtual em MB ou KB
-                        elif line.startswith("RssShmem:"):
-                            shared_mem = line.split(":")[1].strip().split()[0]
-                            shared_mem = self._kb_to_mb_gb(int(shared_mem))    # Memória compartilhada em MB ou KB
-                        elif line.startswith("VmExe:"):
-                            textsize = line.split(":")[1].strip().split()[0]
-                            textsize = self._kb_to_mb_gb(int(textsize))    # Tamanho do segmento text em MB ou KB
-                        elif line.startswith("VmData:"):
-                            datasize = line.split(":")[1].strip().split()[0]
-                            datasize = self._kb_to_mb_gb(int(datasize))    # Tamanho do segmento data em MB ou KB
-                        elif line.startswith("VmStk:"):
-                            stacksize = line.split(":")[1].strip().split()[0]
-                            stacksize = self._kb_to_mb_gb(int(stacksize))   # Tamanho do segmento stack em MB ou KB
-                        elif line.startswith("PPid:"):
-                            ppid = line.split(":")[1].strip()   # ID do processo pai (PPID)
-                
-                with open(f"/proc/{pid}/stat", "r") as f:
-                    data = f.read().split()
-                    total_time = int(data[13]) + int(data[14])
-                    cpu_usage = self._get_cpu_usage_process(int(pid), total_time)   # Uso de CPU em porcentagem
-                    processor_time = self._seconds_to_hhmmss(total_time/self._CLK_TCK_PS)  # Tempo de processamento formatado como HH:MM:SS
-                    priority = int(data[17])    # Prioridade
-                    nice = int(data[18])    # Nice
-                    
-                threads = self._get_threads_data(pid)   # Dados das threads do processo
-                
+                if pid not in scan_snapshot:
+                    if os.path.isdir(f"/proc/{pid}"):
+                        # Ainda não passou pela coleta principal: espera a próxima
+                        self._specific_processes_dict[pid] = ()
+                        continue
+                    raise FileNotFoundError(pid)
+                data, cpu_usage, rss_kb, io_rates, status_fields = scan_snapshot[pid]
+                if status_fields is None:
+                    # Aba aberta depois da última coleta principal: lê o status uma vez
+                    with open(f"/proc/{pid}/status", "r") as f:
+                        status_fields = dict(line.split(":", 1) for line in f if ":" in line)
+
+                ppid = data[3]      # ID do processo pai (PPID)
+                name = data[1]      # Nome do processo
+                status = self._get_process_status(data[2])     # Status do processo
+                num_threads = int(data[19])     # Número de threads do processo
+                priority = int(data[17])    # Prioridade
+                nice = int(data[18])    # Nice
+                total_time = int(data[13]) + int(data[14])
+                processor_time = self._seconds_to_hhmmss(total_time/self._CLK_TCK_PS)  # Tempo de processamento formatado como HH:MM:SS
+                username = self._uid_to_username(status_fields["Uid"].split()[0])  # Username (do UID)
+                command = self._get_cmdline(pid, data[21])     # Linha de comando do processo
+
+                # Memória (status), em MB ou KB
+                def status_kb(key):
+                    value = status_fields.get(key)
+                    return self._kb_to_mb_gb(int(value.split()[0])) if value else "N/A"
+                virtual_mem = status_kb("VmSize")      # Memória virtual
+                resident_mem = status_kb("VmRSS")      # Memoria residente (RSS)
+                shared_mem = status_kb("RssShmem")     # Memória compartilhada
+                textsize = status_kb("VmExe")          # Tamanho do segmento text
+                datasize = status_kb("VmData")         # Tamanho do segmento data
+                stacksize = status_kb("VmStk")         # Tamanho do segmento stack
+
+                threads = self._get_threads_data(pid, username, resident_mem)   # Dados das threads do processo
+                alive_tids.update(thread[0] for thread in threads)
+
+                # Escalonamento do processo: CPU da última execução (campo 39 do stat), afinidade e taxas das threads
+                affinity = status_fields.get("Cpus_allowed_list", "N/A").strip()
+                sched = (int(data[38]),) + tuple(round(sum(thread[idx] for thread in threads), 2) for idx in range(7, 12)) + (affinity,)
+
                 # Adiciona os dados do processo específico ao dicionário
                 self._specific_processes_dict[pid] = (pid, ppid, name, username, cpu_usage, status, num_threads,
                                                         priority, nice, processor_time, command, virtual_mem,
                                                         resident_mem, shared_mem, textsize, datasize, stacksize,
-                                                        threads)
+                                                        threads) + io_rates + self._get_smaps_fields(pid) + \
+                                                       (rss_kb, sched, self._numa_sampler.get(pid) or (),
+                                                        self._processes_dict.get(pid, ())[13:15] or ("N/A", ()))
                 
             except:
                 # Processo foi encerrado, será preenchido com tupla nula
                 self._specific_processes_dict[pid] = (None, None, None, None, None, None, None, None, None, None, 
-                                                      None, None, None, None, None, None, None, None)
+                                                      None, None, None, None, None, None, None, None,
+                                                      None, None, None, None, None, None, None, None, None, None,
+                                                      None)
                 continue
 
+        # Descarta cmdlines de processos que não são mais monitorados e contadores de threads encerradas
+        for pid in self._cmdline_cache.keys() - self._specific_processes_dict.keys():
+            del self._cmdline_cache[pid]
+        for prev_data in (self._prev_thrd_data, self._prev_sched_data):
+            for tid in prev_data.keys() - alive_tids:
+                del prev_data[tid]
         return self._specific_processes_dict
 
-    def _get_threads_data(self, pid):
+    def _get_cmdline(self, pid, starttime):
+        """
+        Retorna a linha de comando de um processo, lida uma vez por PID/starttime.
+        """
+        cached = self._cmdline_cache.get(pid)
+        if cached and cached[0] == starttime:
+            return cached[1]
+        with open(f"/proc/{pid}/cmdline", "r") as f:
+            command = f.read().strip().replace('\x00', ' ')
+        self._cmdline_cache[pid] = (starttime, command)
+        return command
+
+    def _get_threads_data(self, pid, username, memory):
         """
         Lista as threads de um processo específico e coleta dados sobre elas.
-        Return: List [(tid, name, username, memory, cpu_usage, status)]
+        De cada thread são lidos o stat, o schedstat (tempo na CPU, espera na fila de execução e timeslices) e o
+        status (trocas de contexto e afinidade); usuário e memória (espaço de endereçamento compartilhado) vêm do processo.
+        Return: List [(tid, name, username, memory, cpu_usage, status, last_cpu, run_rate, wait_rate, slices_rate,
+                       voluntary_rate, involuntary_rate, affinity)]
+                run_rate e wait_rate em ms por segundo; slices_rate e trocas de contexto por segundo
         """
         threads = []
         entries = self.ctypes_functions.list_directory(f"/proc/{pid}/task")
@@ -333,38 +1023,313 @@ class Model:
         for entry in entries:
             if entry.isdigit():  # Checa se a entrada é um número (TID)
                 try:
-                    with open(f"/proc/{pid}/task/{entry}/status", "r") as f:
-                        tid = int(entry)
-                        for line in f:
-                            if line.startswith("Name:"):
-                                name = line.split(":")[1].strip()   # Nome da thread
-                            elif line.startswith("State:"):
-                                status = line.split(":")[1].strip().split()[0]
-                                status = self._get_process_status(status)   # Status da thread
-                            elif line.startswith("Uid:"):
-                                userid = line.split(":")[1].split()[0]
-                                username = self._uid_to_username(userid)    # Username (do UID)
-                            elif line.startswith("VmRSS:"):
-                                memory = line.split(":")[1].strip().split()[0]
-                                memory = self._kb_to_mb_gb(int(memory))  # Uso de memória (RSS) em MB ou KB
-                    
-                    with open(f"/proc/{pid}/task/{tid}/stat", "r") as f:
-                        data = f.read().split()
-                        total_time = int(data[13]) + int(data[14])
-                        cpu_usage = self._get_cpu_usage_process(tid, total_time, is_thread=True)    # Uso de CPU em porcentagem para a thread
+                    tid = int(entry)
+                    with open(f"/proc/{pid}/task/{entry}/stat", "r") as f:
+                        data = self._parse_stat(f.read())
+                    name = data[1]  # Nome da thread
+                    status = self._get_process_status(data[2])   # Status da thread
+                    total_time = int(data[13]) + int(data[14])
+                    cpu_usage = self._get_cpu_usage_process(tid, total_time, is_thread=True)    # Uso de CPU em porcentagem para a thread
+                    last_cpu = int(data[38])    # CPU em que a thread rodou por último
+
+                    # Escalonamento: taxas calculadas pela variação desde a última coleta
+                    counters, affinity = self._read_sched_counters(f"/proc/{pid}/task/{entry}")
+                    run_rate, wait_rate, slices_rate, voluntary_rate, involuntary_rate = self._get_rates(
+                        self._prev_sched_data, tid, counters)
 
                     # Adiciona os dados da thread à lista
-                    threads.append((tid, name, username, memory, cpu_usage, status))
+                    threads.append((tid, name, username, memory, cpu_usage, status, last_cpu,
+                                    round(run_rate / 1e6, 2), round(wait_rate / 1e6, 2), round(slices_rate, 1),
+                                    round(voluntary_rate, 1), round(involuntary_rate, 1), affinity))
                 except:
                     # Thread foi encerrada, não será incluída
                     continue
         return threads
 
+    def _get_hot_threads_data(self):
+        """
+        Varre as threads de todos os processos e ranqueia pelo uso de CPU desde a última varredura.
+        Para manter o custo baixo:
+        - só o stat é lido (do processo e das threads), e só os campos de tempo são convertidos;
+        - se o tempo de CPU do processo não mudou, nenhuma thread dele rodou e as threads não são listadas;
+        - processos de uma thread só usam o stat do próprio processo;
+        - o top N fica em um heap limitado, e nome/status/dono só são extraídos para as threads do top N;
+        - com filtros de escopo, só os processos da última coleta principal (já filtrados) são varridos.
+        Return: Tuple (List [(tid, name, pid, process_name, username, cpu_usage, status)], threads lidas, custo em s)
+        """
+        start = time.perf_counter()
+        now = time.time()
+        elapsed = now - self._hot_threads_time if self._hot_threads_time else 0.0
+        self._hot_threads_time = now
+
+        heap = []       # [(ticks no intervalo, tid, pid, stat da thread, stat do processo)], menor no topo
+        current = {}
+        scanned = 0
+        if self._scope.active:
+            entries = [str(pid) for pid in list(self._processes_dict)]
+        else:
+            entries = self.ctypes_functions.list_directory("/proc")
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "rb") as f:
+                    raw = f.read()
+            except OSError:
+                continue
+            # Campos após o nome: [0] é o estado (campo 3 do kernel), [11]/[12] utime/stime, [17] num_threads, [19] starttime
+            fields = raw[raw.rfind(b")") + 2:].split()
+            pid = int(entry)
+            starttime = fields[19]
+            proc_ticks = int(fields[11]) + int(fields[12])
+            scanned += 1
+            prev = self._prev_hot_threads.get(pid)
+            if prev is not None and prev[0] != starttime:
+                prev = None     # PID reutilizado
+            if prev is not None and prev[1] == proc_ticks:
+                current[pid] = prev
+                continue
+            # Processos de uma thread usam os ticks do stat do processo, que incluem a CPU de threads já encerradas:
+            # na troca entre uma e várias threads os ticks não são comparáveis e a varredura vira a nova base
+            single = int(fields[17]) == 1
+            prev_threads = prev[2] if prev is not None and prev[3] == single else {}
+
+            if single:
+                stats = [(pid, raw, proc_ticks)]
+            else:
+                stats = []
+                for task in self.ctypes_functions.list_directory(f"/proc/{entry}/task"):
+                    if not task.isdigit():
+                        continue
+                    try:
+                        with open(f"/proc/{entry}/task/{task}/stat", "rb") as f:
+                            task_raw = f.read()
+                    except OSError:
+                        continue
+                    task_fields = task_raw[task_raw.rfind(b")") + 2:].split()
+                    stats.append((int(task), task_raw, int(task_fields[11]) + int(task_fields[12])))
+                    scanned += 1
+
+            threads = {}
+            for tid, thread_raw, ticks in stats:
+                threads[tid] = ticks
+                # Threads novas contam a partir desta varredura
+                delta = ticks - prev_threads.get(tid, ticks)
+                if delta <= 0:
+                    continue
+                if len(heap) < self._HOT_THREADS_TOP_N:
+                    heapq.heappush(heap, (delta, tid, pid, thread_raw, raw))
+                elif delta > heap[0][0]:
+                    heapq.heapreplace(heap, (delta, tid, pid, thread_raw, raw))
+            current[pid] = (starttime, proc_ticks, threads, single)
+        self._prev_hot_threads = current
+
+        hot_threads = []
+        for delta, tid, pid, thread_raw, raw in sorted(heap, reverse=True):
+            name = thread_raw[thread_raw.find(b"(") + 1:thread_raw.rfind(b")")].decode(errors="replace")
+            status = self._get_process_status(thread_raw[thread_raw.rfind(b")") + 2:][:1].decode())
+            process = self._processes_dict.get(pid)
+            if process:
+                process_name, username = process[1], process[2]
+            else:
+                process_name = raw[raw.find(b"(") + 1:raw.rfind(b")")].decode(errors="replace")
+                try:
+                    username = self._uid_to_username(os.stat(f"/proc/{pid}").st_uid)
+                except OSError:
+                    username = "N/A"
+            cpu_usage = (delta / elapsed / self._CLK_TCK_PS) * 100.0 if elapsed > 0 else 0.0
+            hot_threads.append((tid, name, pid, process_name, username, round(cpu_usage, 2), status))
+        return hot_threads, scanned, time.perf_counter() - start
+
+    def _read_sched_counters(self, path):
+        """
+        Lê os contadores de escalonamento de uma thread (path: /proc/<pid>/task/<tid>).
+        Return: Tuple ((run_ns, wait_ns, timeslices, voluntary_ctxt_switches, nonvoluntary_ctxt_switches), affinity)
+                (contadores ausentes valem 0, ex.: kernel sem schedstat)
+        """
+        run_ns = wait_ns = timeslices = voluntary = involuntary = 0
+        affinity = "N/A"
+        try:
+            with open(f"{path}/schedstat", "r") as f:
+                run_ns, wait_ns, timeslices = (int(x) for x in f.read().split()[:3])
+        except (OSError, ValueError):
+            pass
+        try:
+            with open(f"{path}/status", "r") as f:
+                for line in f:
+                    if line.startswith("Cpus_allowed_list:"):
+                        affinity = line.split(":", 1)[1].strip()
+                    elif line.startswith("voluntary_ctxt_switches:"):
+                        voluntary = int(line.split(":", 1)[1])
+                    elif line.startswith("nonvoluntary_ctxt_switches:"):
+                        involuntary = int(line.split(":", 1)[1])
+        except (OSError, ValueError):
+            pass
+        return (run_ns, wait_ns, timeslices, voluntary, involuntary), affinity
+
+    def _track_births(self):
+        """
+        Uma checagem do rastreador de nascimentos (caminho rápido, sem varrer /proc):
+        - lê o último PID alocado em /proc/loadavg; se não mudou, nenhum processo/thread nasceu e nada mais é lido;
+        - senão, lê o total de forks em /proc/stat e abre só os PIDs novos (do último PID visto até o atual);
+        - os processos nascidos recentemente têm o stat relido a cada checagem (nome após o exec e CPU acumulada);
+          quando o stat some, o processo encerrou e entra no resumo. Os que vivem mais que 2 * DT saem do
+          acompanhamento (a coleta principal já os mostra).
+        """
+        now = time.time()
+        try:
+            with open("/proc/loadavg", "r") as f:
+                last_pid = int(f.read().split()[4])
+        except (OSError, ValueError, IndexError):
+            return
+
+        if last_pid != self._last_pid:
+            total_forks = self._total_forks
+            try:
+                with open("/proc/stat", "r") as f:
+                    for line in f:
+                        if line.startswith("processes "):
+                            total_forks = int(line.split()[1])
+                            break
+            except (OSError, ValueError):
+                pass
+
+            if self._last_pid is not None:
+                # PIDs novos desde a última checagem (com a volta ao início depois de pid_max), só os últimos
+                # _SHORT_LIVED_MAX_SCAN: na volta, o fim antes de pid_max e o começo até o PID atual
+                max_scan = self._SHORT_LIVED_MAX_SCAN
+                if last_pid > self._last_pid:
+                    new_pids = range(max(self._last_pid + 1, last_pid + 1 - max_scan), last_pid + 1)
+                else:
+                    before_wrap = max(0, max_scan - last_pid)
+                    new_pids = list(range(max(self._last_pid + 1, self._PID_MAX - before_wrap), self._PID_MAX)) + \
+                               list(range(max(1, last_pid + 1 - max_scan), last_pid + 1))
+                seen = 0
+                for pid in new_pids:
+                    stat = self._read_newborn_stat(pid)
+                    if stat is None:
+                        continue
+                    seen += 1
+                    if self._is_thread(pid):
+                        # Thread de outro processo (também consome PIDs), não é acompanhada
+                        continue
+                    self._newborns[pid] = stat + (now,)
+                # Forks que não chegaram a ser vistos (nasceram e morreram entre duas checagens)
+                forks = total_forks - self._total_forks if total_forks is not None and self._total_forks is not None else 0
+                self._forks_history.append((now, forks, max(forks - seen, 0)))
+            self._last_pid = last_pid
+            self._total_forks = total_forks
+
+        # Relê os processos acompanhados; os que sumiram encerraram
+        for pid, (starttime, name, ticks, born) in list(self._newborns.items()):
+            stat = self._read_newborn_stat(pid)
+            if stat is None or stat[0] != starttime:
+                self._exits.append((now, name, ticks))
+                del self._newborns[pid]
+            elif now - born > 2 * self._DT:
+                del self._newborns[pid]
+            else:
+                self._newborns[pid] = (starttime, stat[1], stat[2], born)
+
+        while self._exits and now - self._exits[0][0] > self._SHORT_LIVED_WINDOW:
+            self._exits.popleft()
+        while self._forks_history and now - self._forks_history[0][0] > self._SHORT_LIVED_WINDOW:
+            self._forks_history.popleft()
+
+    def _read_newborn_stat(self, pid):
+        """
+        Lê o stat de um PID recém-alocado (o PID pode ser de uma thread: /proc/<tid> existe, só não é listado).
+        Return: Tuple (starttime, name, ticks de CPU) ou None se o PID não existe (mais)
+        """
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+        fields = raw[raw.rfind(b")") + 2:].split()
+        name = raw[raw.find(b"(") + 1:raw.rfind(b")")].decode(errors="replace")
+        return fields[19], name, int(fields[11]) + int(fields[12])
+
+    def _is_thread(self, pid):
+        """
+        Checa se um PID é uma thread (e não o líder de um processo): o Tgid do status é diferente do próprio PID.
+        Só as primeiras linhas do status são lidas.
+        """
+        try:
+            with open(f"/proc/{pid}/status", "r") as f:
+                for line in f:
+                    if line.startswith("Tgid:"):
+                        return int(line.split()[1]) != pid
+        except (OSError, ValueError):
+            pass
+        return False
+
+    def _get_short_lived_data(self):
+        """
+        Resume os processos de vida curta encerrados na janela recente, agrupados pelo nome.
+        Return: Tuple (List [(name, exits, cpu_seconds)] ordenada por número de saídas, forks por segundo,
+                       forks não vistos na janela)
+        """
+        summary = {}
+        for _, name, ticks in list(self._exits):
+            exits, cpu_ticks = summary.get(name, (0, 0))
+            summary[name] = (exits + 1, cpu_ticks + ticks)
+        rows = sorted(((name, exits, round(cpu_ticks / self._CLK_TCK_PS, 2))
+                       for name, (exits, cpu_ticks) in summary.items()), key=lambda row: (-row[1], row[0]))
+        history = list(self._forks_history)
+        window = min(self._SHORT_LIVED_WINDOW, time.time() - history[0][0]) if history else 0
+        forks_rate = sum(forks for _, forks, _ in history) / window if window > 0 else 0.0
+        missed = sum(missed for _, _, missed in history)
+        return rows, round(forks_rate, 1), missed
+
+    def _get_pressure_data(self):
+        """
+        Coleta o pressure stall information (PSI) do sistema em /proc/pressure.
+        Return: Dictionary {recurso: (some_avg10, some_avg60, some_avg300, some_rate,
+                                      full_avg10, full_avg60, full_avg300, full_rate)} com recurso em cpu, memory, io
+                some_rate e full_rate: porcentagem do tempo em stall desde a última coleta
+                (vazio se o kernel não tiver PSI)
+        """
+        pressure = {}
+        for resource in ("cpu", "memory", "io"):
+            data = self._read_pressure(f"/proc/pressure/{resource}", self._prev_pressure_data, resource)
+            if data is not None:
+                pressure[resource] = data
+        return pressure
+
+    def _read_pressure(self, path, prev_data, id):
+        """
+        Lê um arquivo de PSI (/proc/pressure/<recurso> ou <cgroup>/<recurso>.pressure).
+        prev_data: dicionário de totais anteriores da thread que chama (sistema ou cgroups), com a chave id.
+        As médias vêm prontas do kernel; a taxa de stall vem da variação do total (microssegundos em stall).
+        Return: Tuple (some_avg10, some_avg60, some_avg300, some_rate, full_avg10, full_avg60, full_avg300, full_rate)
+                ou None se o arquivo não existir. A linha "full" não existe para cpu em kernels antigos (zeros).
+        """
+        values = {"some": (0.0, 0.0, 0.0, 0), "full": (0.0, 0.0, 0.0, 0)}
+        try:
+            with open(path, "r") as f:
+                for line in f:
+                    kind, *fields = line.split()
+                    # "some avg10=0.00 avg60=0.00 avg300=0.00 total=0"
+                    fields = [field.partition("=")[2] for field in fields]
+                    values[kind] = (float(fields[0]), float(fields[1]), float(fields[2]), int(fields[3]))
+        except (OSError, ValueError, IndexError):
+            return None
+        # Microssegundos em stall por segundo / 10^4 = porcentagem do tempo
+        some_rate, full_rate = self._get_rates(prev_data, id, (values["some"][3], values["full"][3]))
+        return values["some"][:3] + (round(some_rate / 1e4, 2),) + values["full"][:3] + (round(full_rate / 1e4, 2),)
+
     def _get_general_stats_data(self):
         """
         Coleta dados gerais sobre o sistema operacional.
         Return: List [total_memory, used_memory, memory_usage, total_swap, used_swap, swap_usage, cpu_usage,
-                        num_procs, num_threads, load_avg, uptime]
+                        num_procs, num_threads, load_avg, uptime, disk_io, net_io, memory_kb, cpu_topology,
+                        numa_nodes, numa_processes, socket_totals]
+                memory_kb: (total_memory, used_memory, total_swap, used_swap) numéricos, em KB
+                cpu_topology: {cpu: (socket, nó NUMA)} de cada CPU lógica
+                numa_nodes, numa_processes: ver _get_numa_data
+                socket_totals: (tcp_established, tcp_listen, tcp_close_wait, tcp_other, udp, unix, tcp_time_wait)
+                               do sistema, da última coleta de processos (ver _build_socket_index)
         """
         self._general_stats_list = []
 
@@ -380,6 +1345,9 @@ class Model:
             num_threads = 0
             load_avg = []
             uptime = "N/A"
+            disk_io = []
+            net_io = []
+            memory_kb = (0, 0, 0, 0)
 
             with open("/proc/meminfo", "r") as f:
                 for line in f:
@@ -398,11 +1366,13 @@ class Model:
             
                 used_memory = int(total_memory) - int(free_memory) - int(buffers_memory) - int(cached_memory)
                 memory_usage = 100.0 * used_memory / int(total_memory) if int(total_memory) > 0 else 0.0    # Uso de memória em porcentagem
+                memory_kb = (int(total_memory), used_memory)
                 used_memory = self._kb_to_mb_gb(int(used_memory))   # Uso de memória em MB ou GB
                 total_memory = self._kb_to_mb_gb(int(total_memory))   # Memória total em MB ou GB
 
                 used_swap = int(total_swap) - int(free_swap)    
                 swap_usage = 100.0 * used_swap / int(total_swap) if int(total_swap) > 0 else 0.0    # Uso de swap em porcentagem
+                memory_kb += (int(total_swap), used_swap)
                 used_swap = self._kb_to_mb_gb(int(used_swap))   # Uso de swap em MB ou GB
                 total_swap = self._kb_to_mb_gb(int(total_swap))   # Swap total em MB ou GB
 
@@ -416,27 +1386,179 @@ class Model:
 
             cpu_usage = self._get_cpu_usage_system()        # Uso de CPU em porcentagem
             num_procs, num_threads = self._get_total_thr_procs()    # Total de processos e threads no sistema
+            disk_io = self._get_disk_io()   # Taxas de leitura/escrita por disco
+            net_io = self._get_net_io()     # Taxas de recepção/transmissão por interface
         
             # Adiciona os dados gerais do sistema à lista
             self._general_stats_list = [total_memory, used_memory, memory_usage, total_swap, used_swap,
-                                        swap_usage, cpu_usage, num_procs, num_threads, load_avg, uptime]
+                                        swap_usage, cpu_usage, num_procs, num_threads, load_avg, uptime,
+                                        disk_io, net_io, memory_kb, self._cpu_topology]
+            self._general_stats_list += self._get_numa_data(cpu_usage)
+            self._general_stats_list.append(self._socket_totals)
         except:
             pass
 
         return self._general_stats_list
         
-    def _uid_to_username(self, uid):
+    def _get_cgroups_data(self):
         """
-        Converte um UID em um nome de usuário.
+        Coleta dados de cada cgroup v2 da hierarquia.
+        Os contadores vêm dos arquivos do próprio cgroup (muito mais barato que somar os dados de cada PID);
+        os PIDs membros vêm de /proc/<pid>/cgroup, com cache.
+        Return: List [(path, cpu_usage, memory, anon, file, io_read_rate, io_write_rate, (pids), pressure)]
+                pressure: (cpu_some_rate, memory_some_rate, memory_full_rate, io_some_rate, io_full_rate),
+                          porcentagem do tempo em stall desde a última coleta (ver _read_pressure)
         """
+        self._cgroups_list = []
+        if not self._cgroup_root:
+            return self._cgroups_list
+
+        # Membros de cada cgroup, a partir da última lista de processos
+        members = {}
+        pids = set(self._processes_dict)
+        for pid in pids:
+            path = self._get_pid_cgroup(pid)
+            if path is not None:
+                members.setdefault(path, []).append(pid)
+        for pid in self._pid_cgroup_cache.keys() - (pids | self._scan_pids):
+            self._pid_cgroup_cache.pop(pid, None)   # Também podado pela thread de processos
+
+        seen = set()
+        stack = ["/"]
+        while stack:
+            path = stack.pop()
+            directory = self._cgroup_root + path.rstrip("/")
+            try:
+                cpu_usage = 0.0
+                memory = "N/A"
+                anon = "N/A"
+                file = "N/A"
+                io_read_rate = 0.0
+                io_write_rate = 0.0
+
+                # cpu.stat: usage_usec (tempo de CPU acumulado em microssegundos)
+                usage_usec = self._read_keyed_file(f"{directory}/cpu.stat").get("usage_usec")
+                # io.stat: uma linha por dispositivo ("8:0 rbytes=N wbytes=N rios=N wios=N ...")
+                rbytes = wbytes = 0
+                try:
+                    with open(f"{directory}/io.stat", "r") as f:
+                        for line in f:
+                            for field in line.split()[1:]:
+                                key, _, value = field.partition("=")
+                                if key == "rbytes":
+                                    rbytes += int(value)
+                                elif key == "wbytes":
+                                    wbytes += int(value)
+                except OSError:
+                    pass
+                cpu_rate, io_read_rate, io_write_rate = self._get_rates(self._prev_cgroup_data, path,
+                                                                        (usage_usec or 0, rbytes, wbytes))
+                cpu_usage = round(cpu_rate / 1e6 * 100.0, 2)   # Uso de CPU em porcentagem (de um núcleo)
+                io_read_rate, io_write_rate = io_read_rate / (1024 * 1024), io_write_rate / (1024 * 1024)
+
+                try:
+                    with open(f"{directory}/memory.current", "r") as f:
+                        memory = self._kb_to_mb_gb(int(f.read()) // 1024)  # Memória total do cgroup
+                except (OSError, ValueError):
+                    pass
+                memory_stat = self._read_keyed_file(f"{directory}/memory.stat")
+                if "anon" in memory_stat:
+                    anon = self._kb_to_mb_gb(memory_stat["anon"] // 1024)    # Memória anônima
+                    file = self._kb_to_mb_gb(memory_stat["file"] // 1024)    # Page cache
+
+                # PSI do cgroup (a raiz não tem arquivos *.pressure: usa o do sistema)
+                pressure_dir = directory if path != "/" else "/proc/pressure"
+                stalls = {}
+                for resource in ("cpu", "memory", "io"):
+                    suffix = ".pressure" if path != "/" else ""
+                    stalls[resource] = self._read_pressure(f"{pressure_dir}/{resource}{suffix}",
+                                                            self._prev_cgroup_pressure_data, (path, resource)) \
+                        or (0.0,) * 8
+                pressure = (stalls["cpu"][3], stalls["memory"][3], stalls["memory"][7], stalls["io"][3],
+                            stalls["io"][7])
+
+                self._cgroups_list.append((path, cpu_usage, memory, anon, file, io_read_rate, io_write_rate,
+                                           tuple(members.get(path, ())), pressure))
+                seen.add(path)
+            except OSError:
+                # cgroup foi removido durante a leitura
+                continue
+            for child in sorted(self.ctypes_functions.list_subdirectories(directory), reverse=True):
+                stack.append(path.rstrip("/") + "/" + child)
+
+        # Descarta contadores de cgroups removidos
+        for path in self._prev_cgroup_data.keys() - seen:
+            del self._prev_cgroup_data[path]
+        for key in [key for key in self._prev_cgroup_pressure_data if key[0] not in seen]:
+            del self._prev_cgroup_pressure_data[key]
+        return self._cgroups_list
+
+    def _find_cgroup2_root(self):
+        """
+        Encontra a raiz da hierarquia cgroup v2 (unificada ou híbrida).
+        Return: String com o caminho ou None se o sistema não usar cgroup v2
+        """
+        for root in ("/sys/fs/cgroup", "/sys/fs/cgroup/unified"):
+            try:
+                with open(f"{root}/cgroup.controllers", "r"):
+                    return root
+            except OSError:
+                continue
+        return None
+
+    def _get_pid_cgroup(self, pid):
+        """
+        Retorna o cgroup v2 de um processo (linha "0::<path>" de /proc/<pid>/cgroup), usando cache.
+        """
+        now = time.time()
+        entry = self._pid_cgroup_cache.get(pid)
+        if entry and now - entry[1] < self._PID_CGROUP_TTL:
+            return entry[0]
+        path = None
         try:
-            with open(f"/etc/passwd", "r") as f:
+            with open(f"/proc/{pid}/cgroup", "r") as f:
                 for line in f:
-                    if str(uid) in line:
-                        return line.split(":")[0]
-            return str(uid)
-        except:
-            return str(uid)
+                    if line.startswith("0::"):
+                        path = line[3:].strip()
+                        break
+        except OSError:
+            return None
+        self._pid_cgroup_cache[pid] = (path, now)
+        return path
+
+    def _read_keyed_file(self, path):
+        """
+        Lê um arquivo no formato "chave valor" por linha (cpu.stat, memory.stat, etc.).
+        Return: Dictionary {chave: valor inteiro} (vazio se o arquivo não existir)
+        """
+        values = {}
+        try:
+            with open(path, "r") as f:
+                for line in f:
+                    key, _, value = line.partition(" ")
+                    if value.strip().isdigit():
+                        values[key] = int(value)
+        except OSError:
+            pass
+        return values
+
+    def _uid_to_username(self, uid):
+        """
+        Converte um UID em um nome de usuário (com cache, para não reler /etc/passwd a cada processo).
+        """
+        uid = str(uid)
+        if uid not in self._usernames:
+            self._usernames[uid] = uid
+            try:
+                with open("/etc/passwd", "r") as f:
+                    for line in f:
+                        fields = line.split(":")
+                        if len(fields) > 2 and fields[2] == uid:
+                            self._usernames[uid] = fields[0]
+                            break
+            except OSError:
+                pass
+        return self._usernames[uid]
     
     def _get_process_status(self, status):
         """
@@ -467,72 +1589,285 @@ class Model:
         Calcula o uso de CPU de um processo ou thread específico.
         """
 
-        current_time = time.time()
-        # Tempo anterior medido
-        if is_thread:
-            prev_total_time, prev_time = self._prev_thrd_data.get(id, (0, current_time))
-        else:
-            prev_total_time, prev_time = self._prev_proc_data.get(id, (0, current_time))
+        prev_data = self._prev_thrd_data if is_thread else self._prev_proc_data
+        # Ticks de CPU por segundo desde a ultima checagem
+        ticks_rate, = self._get_rates(prev_data, id, (total_time,))
+        cpu_usage = (ticks_rate / self._CLK_TCK_PS) * 100.0
+        return round(cpu_usage, 2)
 
-        delta_cpu_time = (total_time - prev_total_time)/self._CLK_TCK_PS  # Variação de tempo desde a ultima checagem (em segundos)
+    def _get_rates(self, prev_data, id, counters):
+        """
+        Calcula a taxa por segundo de contadores cumulativos (tempo de CPU, bytes lidos, etc.).
+        prev_data guarda a última medição de cada id: {id: (contadores, tempo)}.
+        Return: Tuple com a taxa de cada contador (0.0 na primeira medição)
+        """
+        current_time = time.time()
+        # Medição anterior
+        prev_counters, prev_time = prev_data.get(id, (counters, current_time))
         elapsed_time = current_time - prev_time     # Tempo decorrido desde a ultima checagem (em segundos)
 
-        # Atualiza os dados anteriores com o tempo atual e o tempo total
-        if is_thread:
-            self._prev_thrd_data.update({id: (total_time, current_time)})
-        else:
-            self._prev_proc_data.update({id: (total_time, current_time)})
+        # Atualiza os dados anteriores com o tempo atual e os contadores
+        prev_data[id] = (counters, current_time)
 
         if elapsed_time <= 0:
-            return 0.0
-        
-        cpu_usage = (delta_cpu_time / elapsed_time) * 100.0
-        return round(cpu_usage, 2)
+            return tuple(0.0 for _ in counters)
+        return tuple(max(0, curr - prev) / elapsed_time for curr, prev in zip(counters, prev_counters))
+
+    def _read_process_io(self, pid):
+        """
+        Lê os contadores de I/O de um processo (/proc/<pid>/io).
+        Return: Tuple (rchar, wchar, syscr, syscw, read_bytes, write_bytes) ou None se não for permitido ler
+        """
+        try:
+            with open(f"/proc/{pid}/io", "r") as f:
+                data = f.read().split()
+            # Formato fixo: "rchar: N wchar: N syscr: N syscw: N read_bytes: N write_bytes: N cancelled_write_bytes: N"
+            return tuple(int(data[i]) for i in (1, 3, 5, 7, 9, 11))
+        except (OSError, IndexError, ValueError):
+            return None
+
+    def _read_smaps_rollup(self, pid):
+        """
+        Lê a memória detalhada de um processo (/proc/<pid>/smaps_rollup).
+        Caro para espaços de endereçamento grandes, por isso só é chamado pelo CostAwareSampler.
+        Return: Tuple (pss, uss, swap) em KB ou None se não for possível ler
+        """
+        pss = uss = swap = 0
+        try:
+            with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+                for line in f:
+                    if line.startswith("Pss:"):
+                        pss = int(line.split()[1])      # Proportional Set Size
+                    elif line.startswith(("Private_Clean:", "Private_Dirty:")):
+                        uss += int(line.split()[1])     # Unique Set Size (páginas privadas)
+                    elif line.startswith("Swap:"):
+                        swap = int(line.split()[1])
+        except (OSError, IndexError, ValueError):
+            return None
+        return (pss, uss, swap)
+
+    def _sample_smaps(self, rss_kb):
+        """
+        Amostra smaps_rollup priorizando processos com aba aberta, visíveis na View e os de maior RSS.
+        rss_kb: Dictionary {pid: RSS em KB} da coleta atual.
+        """
+        by_rss = sorted(rss_kb, key=rss_kb.get, reverse=True)
+        priority = [pid for pid in list(self._specific_processes_dict) if pid in rss_kb]
+        priority += [pid for pid in self._visible_pids if pid in rss_kb]
+        priority += by_rss[:self._SMAPS_TOP_N]
+        # Os demais só são lidos se sobrar orçamento
+        self._smaps_sampler.sample(priority + by_rss[self._SMAPS_TOP_N:])
+        self._smaps_sampler.prune(rss_kb.keys())
+
+    def _get_smaps_fields(self, pid):
+        """
+        Retorna (pss, uss, swap) formatados a partir do cache do smaps_rollup ("N/A" se ainda não amostrado).
+        """
+        smaps = self._smaps_sampler.get(pid)
+        if not smaps:
+            return ("N/A", "N/A", "N/A")
+        return tuple(self._kb_to_mb_gb(kb) for kb in smaps)
+
+    def _get_disk_io(self):
+        """
+        Coleta as taxas de I/O de cada disco (/proc/diskstats), ignorando partições.
+        Return: List [(device, read_rate, write_rate)] em MB/s
+        """
+        disk_io = []
+        try:
+            # Discos inteiros aparecem em /sys/block (partições não)
+            disks = set(self.ctypes_functions.list_directory("/sys/block"))
+            with open("/proc/diskstats", "r") as f:
+                for line in f:
+                    data = line.split()
+                    name = data[2]
+                    if name not in disks or name.startswith(("loop", "ram")):
+                        continue
+                    # Setores lidos (campo 6) e escritos (campo 10), de 512 bytes
+                    read_rate, write_rate = self._get_rates(self._prev_disk_data, name, (int(data[5]), int(data[9])))
+                    disk_io.append((name, read_rate * 512 / (1024 * 1024), write_rate * 512 / (1024 * 1024)))
+        except:
+            return []
+        return disk_io
+
+    def _get_net_io(self):
+        """
+        Coleta as taxas de tráfego de cada interface de rede (/proc/net/dev).
+        Return: List [(interface, rx_rate, tx_rate)] em MB/s
+        """
+        net_io = []
+        try:
+            with open("/proc/net/dev", "r") as f:
+                lines = f.read().splitlines()[2:]  # Pula o cabeçalho
+            for line in lines:
+                name, data = line.split(":", 1)
+                data = data.split()
+                name = name.strip()
+                # Bytes recebidos (1a coluna) e transmitidos (9a coluna)
+                rx_rate, tx_rate = self._get_rates(self._prev_net_data, name, (int(data[0]), int(data[8])))
+                net_io.append((name, rx_rate / (1024 * 1024), tx_rate / (1024 * 1024)))
+        except:
+            return []
+        return net_io
     
     def _get_cpu_usage_system(self):
         """
-        Coleta o uso de CPU do sistema.
+        Coleta o uso de CPU do sistema (total e por CPU lógica) desde a última coleta.
+        Usa a variação dos tempos de /proc/stat; idle e iowait contam como tempo ocioso.
+        Return: List [(cpu, uso em %)], o primeiro item é o total ("cpu")
         """
         cpu_usage = []
-        cpus = []
         try:
             with open("/proc/stat", "r") as f:
                 data = f.read().splitlines()
-                for line in data:
-                    if line.startswith("cpu"):
-                        cpus.append(line.split())
-                if not cpus:
-                    return []
-            for cpu in cpus:
-                if len(cpu) < 5:
-                    continue
-                idle_time = float(cpu[4]) / self._CLK_TCK_PS  # Tempo idle em segundos
-                total_time = sum(float(x) for x in cpu[1:]) / self._CLK_TCK_PS  # Tempo total em segundos
-                usage = 100.0 * (1 - idle_time / total_time) if total_time > 0 else 0.0  # Uso de CPU em porcentagem
-                cpu_usage.append((cpu[0], round(usage, 2)))
-                if not cpu_usage:
-                    return []
         except:
             return []
-        
+        for line in data:
+            if not line.startswith("cpu"):
+                # As linhas de CPU vêm todas no início do arquivo
+                break
+            cpu = line.split()
+            if len(cpu) < 6:
+                continue
+            # guest e guest_nice (campos 9 e 10) já estão contados em user e nice
+            times = [int(x) for x in cpu[1:9]]
+            idle_rate, total_rate = self._get_rates(self._prev_cpu_data, cpu[0], (times[3] + times[4], sum(times)))
+            usage = 100.0 * (1 - idle_rate / total_rate) if total_rate > 0 else 0.0
+            cpu_usage.append((cpu[0], round(usage, 2)))
         return cpu_usage
 
-    def _get_total_thr_procs(self):
+    def _get_numa_data(self, cpu_usage):
         """
-        Coleta o número total de processos e threads no sistema.
+        Coleta memória e alocações por nó NUMA (/sys/devices/system/node/node*/meminfo e numastat) e agrupa o uso de
+        CPU por nó. A fração de alocações locais vem da variação de local_node e other_node desde a última coleta.
+        Também monta o placement por nó dos processos de maior RSS já amostrados (ver _sample_numa_maps).
+        Return: Tuple (List [(node, num_cpus, cpu_usage, total_kb, used_kb, local_ratio, remote_rate)],
+                       List [(pid, name, ((node, kb), ...))])
+                local_ratio: % das alocações no intervalo que foram no próprio nó (None se não houve alocações)
+                remote_rate: alocações (páginas/s) feitas neste nó por processos rodando em outro nó
         """
-        total_procs = 0
-        total_threads = 0
-        entries = self.ctypes_functions.list_directory("/proc")
-        for entry in entries:
-            if entry.isdigit():
-                total_procs += 1
+        usage = dict(cpu_usage)
+        nodes = []
+        for node in self._numa_nodes:
+            directory = f"/sys/devices/system/node/node{node}"
+            total_kb = used_kb = 0
+            try:
+                with open(f"{directory}/meminfo", "r") as f:
+                    for line in f:
+                        # "Node 0 MemTotal:        4685560 kB"
+                        fields = line.split()
+                        if fields[2] == "MemTotal:":
+                            total_kb = int(fields[3])
+                        elif fields[2] == "MemUsed:":
+                            used_kb = int(fields[3])
+            except (OSError, IndexError, ValueError):
+                continue
+            numastat = self._read_keyed_file(f"{directory}/numastat")
+            local_rate, remote_rate = self._get_rates(self._prev_numa_data, node,
+                                                      (numastat.get("local_node", 0), numastat.get("other_node", 0)))
+            local_ratio = round(100.0 * local_rate / (local_rate + remote_rate), 2) if local_rate + remote_rate > 0 else None
+            # Uso médio das CPUs do nó
+            cpus = [name for name, (_, cpu_node) in self._cpu_topology.items() if cpu_node == node and name in usage]
+            node_cpu_usage = round(sum(usage[name] for name in cpus) / len(cpus), 2) if cpus else 0.0
+            nodes.append((node, len(cpus), node_cpu_usage, total_kb, used_kb, local_ratio, round(remote_rate, 1)))
+
+        processes = []
+        if len(self._numa_nodes) > 1:
+            by_rss = sorted(self._processes_dict.values(), key=lambda process: process[12], reverse=True)
+            for process in by_rss[:self._NUMA_TOP_N]:
+                placement = self._numa_sampler.get(process[0])
+                if placement:
+                    processes.append((process[0], process[1], placement))
+        return nodes, processes
+
+    def _read_numa_maps(self, pid):
+        """
+        Lê a distribuição da memória de um processo entre os nós NUMA (/proc/<pid>/numa_maps).
+        Caro (percorre as tabelas de páginas), por isso só é chamado pelo CostAwareSampler.
+        Return: Tuple ((node, kb), ...) ordenada pelo nó, ou None se não for possível ler
+        """
+        pages = {}
+        try:
+            with open(f"/proc/{pid}/numa_maps", "r") as f:
+                for line in f:
+                    # "7f... default file=/usr/lib/x.so mapped=2 N0=2 kernelpagesize_kB=4"
+                    page_kb = 4
+                    counts = []
+                    for field in line.split()[2:]:
+                        if field[0] == "N" and "=" in field:
+                            node, _, count = field[1:].partition("=")
+                            counts.append((int(node), int(count)))
+                        elif field.startswith("kernelpagesize_kB="):
+                            page_kb = int(field[18:])
+                    for node, count in counts:
+                        pages[node] = pages.get(node, 0) + count * page_kb
+        except (OSError, ValueError):
+            return None
+        return tuple(sorted(pages.items()))
+
+    def _sample_numa_maps(self, rss_kb):
+        """
+        Amostra numa_maps para processos com aba aberta e os de maior RSS (só se houver mais de um nó NUMA).
+        rss_kb: Dictionary {pid: RSS em KB} da coleta atual.
+        """
+        if len(self._numa_nodes) <= 1:
+            return
+        by_rss = sorted(rss_kb, key=rss_kb.get, reverse=True)
+        priority = [pid for pid in list(self._specific_processes_dict) if pid in rss_kb]
+        self._numa_sampler.sample(priority + by_rss[:self._NUMA_TOP_N])
+        self._numa_sampler.prune(rss_kb.keys())
+
+    def _get_cpu_topology(self):
+        """
+        Lê a topologia das CPUs lógicas em /sys: socket físico e nó NUMA de cada uma.
+        Return: Dictionary {cpu: (socket, nó NUMA)} (ex.: {"cpu0": (0, 0)}), socket/nó 0 se não disponível
+        """
+        nodes = {}
+        for entry in self.ctypes_functions.list_directory("/sys/devices/system/node"):
+            if entry.startswith("node") and entry[4:].isdigit():
                 try:
-                    with open(f"/proc/{entry}/stat", "r") as f:
-                        data = f.read().split()
-                        total_threads += int(data[19])
+                    with open(f"/sys/devices/system/node/{entry}/cpulist", "r") as f:
+                        for cpu in self._parse_cpu_list(f.read()):
+                            nodes[cpu] = int(entry[4:])
                 except:
                     continue
+
+        topology = {}
+        for entry in self.ctypes_functions.list_directory("/sys/devices/system/cpu"):
+            if not (entry.startswith("cpu") and entry[3:].isdigit()):
+                continue
+            try:
+                with open(f"/sys/devices/system/cpu/{entry}/topology/physical_package_id", "r") as f:
+                    socket = max(int(f.read()), 0)
+            except:
+                socket = 0
+            topology[entry] = (socket, nodes.get(int(entry[3:]), 0))
+        return topology
+
+    def _parse_cpu_list(self, text):
+        """
+        Converte uma lista de CPUs no formato do kernel (ex.: "0-3,8,10-11") em uma lista de inteiros.
+        """
+        cpus = []
+        for part in text.strip().split(","):
+            if not part:
+                continue
+            start, _, end = part.partition("-")
+            cpus.extend(range(int(start), int(end or start) + 1))
+        return cpus
+
+    def _get_total_thr_procs(self):
+        """
+        Coleta o número total de processos e threads no sistema, sem abrir nenhum arquivo por processo:
+        os processos vêm da listagem de /proc e as threads do total em "running/total" de /proc/loadavg.
+        """
+        total_procs = sum(1 for entry in self.ctypes_functions.list_directory("/proc") if entry.isdigit())
+        total_threads = 0
+        try:
+            with open("/proc/loadavg", "r") as f:
+                total_threads = int(f.read().split()[3].split("/")[1])
+        except (OSError, ValueError, IndexError):
+            pass
         return total_procs, total_threads
     
     def _seconds_to_hhmmss(self, seconds):
@@ -1,11 +1,28 @@
 import tkinter as tk
 import ttkbootstrap as ttk
+from graphs import SparklineGraph, HeatmapGrid
 
 class View:
     """
     Classe View para criar a GUI para o dashboard, separado do Model de fetching de dados.
     A view mostra: stats gerais do sistema operacional, a lista de processos e detalhes específicos de cada um, se o usuário quiser.
     """
+    # Valor usado para ordenar cada coluna da lista de processos (a partir da tupla do processo)
+    PROCESS_SORT_KEYS = {
+        'PID': lambda process: process[0],
+        'Name': lambda process: process[1],
+        'User': lambda process: process[2],
+        'Priority': lambda process: process[3],
+        'Memory': lambda process: process[12],
+        'CPU': lambda process: process[5],
+        'State': lambda process: process[6],
+        'Read': lambda process: process[7],
+        'Write': lambda process: process[8],
+        'FDs': lambda process: process[13],
+        'Sockets': lambda process: sum(process[14]) if process[14] else "N/A",
+        'Growth': lambda process: process[15][0] if process[15] else 0,
+    }
+
     def __init__ (self, specific_process_req_queue):
         # Inicializa a janela principal
         self.root = ttk.Window(themename="darkly")
@@ -16,16 +33,36 @@ class View:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill='both', expand=True)
 
-        # Dict para dados gerais da lista de processos {pid: [pid, name, user, priority, memory_usage, cpu_usage, status]}
+        # Dict para dados gerais da lista de processos
+        # {pid: [pid, name, user, priority, memory_usage, cpu_usage, status, read_rate, write_rate, pss, uss, swap, rss_kb]}
         self.process_data_dict = {}
         # Dict para dados específicos de processos
         # {pid: [pid, ppid, name, user, cpu, status, num_threads, priority, nice, processor_time, command,
         # virtual_memory, resident_memory, shared_memory, text_segment_size, 
-        # data_segment_size, stack_segment_size, threads]}
+        # data_segment_size, stack_segment_size, threads, read_rate, write_rate, syscr_rate, syscw_rate, pss, uss, swap, rss_kb]}
         self.specific_process_data_dict = {}
         # Lista de dados gerais de sistema [total_memory, used_memory, memory_usage, total_swap, used_swap, swap_usage,
-        # load_avg, uptime, cpu_usage, num_processes, num_threads]
+        # cpu_usage, num_processes, num_threads, load_avg, uptime, disk_io, net_io, memory_kb, cpu_topology,
+        # numa_nodes, numa_processes]
         self.general_stats_data = []
+        # Lista de dados agregados por cgroup [(path, cpu_usage, memory, anon, file, io_read_rate, io_write_rate, (pids), pressure)]
+        self.cgroups_data = []
+        # Ranking de hot threads (List [(tid, name, pid, process_name, username, cpu_usage, status)], threads lidas,
+        # custo da varredura, intervalo até a próxima)
+        self.hot_threads_data = None
+        # Resumo de processos de vida curta (List [(name, exits, cpu_seconds)], forks por segundo, forks não vistos)
+        self.short_lived_data = None
+        # PSI do sistema {recurso: (some_avg10, some_avg60, some_avg300, some_rate, full_avg10, full_avg60, full_avg300, full_rate)}
+        self.pressure_data = None
+        # Última lista de processos recebida (para o drill-down dos cgroups)
+        self.latest_process_data = {}
+        # Últimos dados gerais recebidos (para redesenhar o heatmap de CPU fora de um tick)
+        self.latest_general_stats_data = []
+        # Último ranking de hot threads exibido
+        self.last_hot_threads_data = None
+        # cgroups expandidos na aba de containers / slices e últimos dados exibidos nela
+        self.opened_cgroups = set()
+        self.last_cgroups_data = []
 
         # Dict das abas abertas dos processos especificos {pid: tab_id}
         self.processes_opened_tabs = {}
@@ -33,17 +70,43 @@ class View:
         self.threads_treeviews = {}
         # Dict com as treeviews dos dados dos processos em cada aba {tab_id: treeview}
         self.process_data_treeviews = {}
+        # Dict com os gráficos de histórico (CPU e RSS) de cada aba {tab_id: (cpu_graph, rss_graph)}
+        self.process_graphs = {}
 
         # Queue de requests para processos especificos
         self.specific_process_req_queue = specific_process_req_queue
 
-        # Se a row do uso de CPU foi expandida
+        # PIDs visíveis na lista de processos (informados ao Model para priorizar a coleta)
+        self.visible_pids = []
+
+        # Ordenação da lista de processos (coluna do cabeçalho clicado, None mantém a ordem do Model)
+        self.process_sort_column = None
+        self.process_sort_reverse = False
+
+        # Se os gráficos de uso de CPU por núcleo estão expandidos
         self.cpu_usage_expanded = False
 
-        # Criar aba dos processos
+        # Criar aba dos processos, com uma linha provisória, e desenhar a janela imediatamente
         self.create_process_list_tab()
+        self.process_list_tree.insert('', tk.END, values=('', 'Collecting data...'), tags=("evenrow",))
+        self.root.update()
+        # As demais abas são criadas logo depois, com a janela já na tela
+        self.deferred_tabs_created = False
+        self.root.after(0, self.create_deferred_tabs)
+
+    def create_deferred_tabs(self):
+        """
+        Cria as abas que não aparecem na primeira pintura da janela.
+        """
         # Criar aba dos dados gerais de sistema
         self.create_general_stats_tab()
+        # Criar aba dos cgroups (containers / slices)
+        self.create_cgroups_tab()
+        # Criar aba das threads com maior uso de CPU no sistema
+        self.create_hot_threads_tab()
+        # Criar aba dos processos de vida curta encerrados recentemente
+        self.create_short_lived_tab()
+        self.deferred_tabs_created = True
 
     ###########################
     # Métodos para criar abas #
@@ -57,7 +120,9 @@ class View:
 
         # Treeview para a tabela
         self.process_list_tree = ttk.Treeview(process_list_tab, 
-                                              columns=('PID', 'Name', 'User', 'Priority', 'Memory', 'CPU', 'State'), 
+                                              columns=('PID', 'Name', 'User', 'Priority', 'Memory', 'CPU', 'State',
+                                                       'Read', 'Write', 'PSS', 'USS', 'Swap', 'FDs', 'Sockets',
+                                                       'Growth'), 
                                               show='headings', bootstyle='DARK')
         self.process_list_tree.heading('PID', text='PID', anchor='w')
         self.process_list_tree.heading('Name', text='Name', anchor='w')
@@ -66,13 +131,33 @@ class View:
         self.process_list_tree.heading('Memory', text='Memory', anchor='w')
         self.process_list_tree.heading('CPU', text='CPU(%)', anchor='w')
         self.process_list_tree.heading('State', text='State', anchor='w')
+        self.process_list_tree.heading('Read', text='Read', anchor='w')
+        self.process_list_tree.heading('Write', text='Write', anchor='w')
+        self.process_list_tree.heading('PSS', text='PSS', anchor='w')
+        self.process_list_tree.heading('USS', text='USS', anchor='w')
+        self.process_list_tree.heading('Swap', text='Swap', anchor='w')
+        self.process_list_tree.heading('FDs', text='FDs', anchor='w')
+        self.process_list_tree.heading('Sockets', text='Sockets', anchor='w')
+        self.process_list_tree.heading('Growth', text='Growth', anchor='w')
         self.process_list_tree.column('PID', width=50)
         self.process_list_tree.column('Name', width=150)
-        self.process_list_tree.column('User', width=100)
-        self.process_list_tree.column('Priority', width=80)
-        self.process_list_tree.column('Memory', width=100)
-        self.process_list_tree.column('CPU', width=100)
-        self.process_list_tree.column('State', width=100)
+        self.process_list_tree.column('User', width=80)
+        self.process_list_tree.column('Priority', width=60)
+        self.process_list_tree.column('Memory', width=80)
+        self.process_list_tree.column('CPU', width=70)
+        self.process_list_tree.column('State', width=80)
+        self.process_list_tree.column('Read', width=90)
+        self.process_list_tree.column('Write', width=90)
+        self.process_list_tree.column('PSS', width=80)
+        self.process_list_tree.column('USS', width=80)
+        self.process_list_tree.column('Swap', width=80)
+        self.process_list_tree.column('FDs', width=60)
+        self.process_list_tree.column('Sockets', width=60)
+        self.process_list_tree.column('Growth', width=190)
+
+        # Ordenação por clique no cabeçalho (colunas com valor numérico ou texto na tupla do processo)
+        for column in self.PROCESS_SORT_KEYS:
+            self.process_list_tree.heading(column, command=lambda column=column: self.sort_process_list(column))
 
         # Linhas cores alternadas
         self.process_list_tree.tag_configure("evenrow", background="#222222")
@@ -98,46 +183,78 @@ class View:
         general_stats_tab = ttk.Frame(self.notebook)
         self.notebook.add(general_stats_tab, text="General System Data")
 
-        # Cria a tabela de uso de CPU
+        # Cria o gráfico de uso de CPU (total e, expandindo, por núcleo)
         cpu_frame = ttk.Frame(general_stats_tab)
         cpu_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
         cpu_label_frame = ttk.Labelframe(cpu_frame, text="CPU Usage", padding=(10, 10))
         cpu_label_frame.pack(fill=tk.X, expand=True, padx=5, pady=5)
 
-        self.cpu_usage_treeview = ttk.Treeview(cpu_label_frame, columns=('CPU', 'Usage (%)', 'Graph'), show='headings', bootstyle='DARK', height=5)
-        self.cpu_usage_treeview.heading('CPU', text='CPU', anchor='w')
-        self.cpu_usage_treeview.heading('Usage (%)', text='Usage (%)', anchor='w')
-        self.cpu_usage_treeview.heading('Graph', text='', anchor='w')
-        self.cpu_usage_treeview.column('CPU', width=100, stretch=tk.NO)
-        self.cpu_usage_treeview.column('Usage (%)', width=150, stretch=tk.NO)
-        self.cpu_usage_treeview.column('Graph', stretch=tk.YES)
-        self.cpu_usage_treeview.tag_configure("evenrow", background="#222222")
-        self.cpu_usage_treeview.tag_configure("oddrow", background="#303030")
-
-        self.cpu_usage_treeview.pack(fill=tk.BOTH, expand=True)
-
-        # Bind do evento de click (expandir/colapsar a linha de uso de CPU)
-        self.cpu_usage_treeview.bind('<Button-1>', self.toggle_cpu_row)
-
-        # Cria a tabela de uso de memória
+        self.total_cpu_graph = SparklineGraph(cpu_label_frame, height=50)
+        self.total_cpu_graph.canvas.grid(row=0, column=0, sticky='ew')
+        cores_controls = ttk.Frame(cpu_label_frame)
+        cores_controls.grid(row=1, column=0, sticky='ew')
+        self.cpu_cores_button = ttk.Button(cores_controls, text="▸  Cores", bootstyle='link', command=self.toggle_cpu_cores)
+        self.cpu_cores_button.pack(side=tk.LEFT)
+        # Agrupamento das CPUs lógicas no heatmap
+        self.cpu_grouping = tk.StringVar(value="No grouping")
+        grouping_box = ttk.Combobox(cores_controls, textvariable=self.cpu_grouping, state='readonly', width=14,
+                                    values=("No grouping", "Socket", "NUMA node"))
+        grouping_box.pack(side=tk.RIGHT)
+        grouping_box.bind('<<ComboboxSelected>>', lambda event: self.update_cpu_heatmap())
+        # Heatmap com uma célula por CPU lógica (exibido só se expandido)
+        self.cpu_cores_frame = ttk.Frame(cpu_label_frame)
+        self.cpu_heatmap = HeatmapGrid(self.cpu_cores_frame)
+        self.cpu_heatmap.canvas.pack(fill=tk.X, expand=True)
+        cpu_label_frame.grid_columnconfigure(0, weight=1)
+
+        # Cria os gráficos de uso de memória e swap
         memory_frame = ttk.Frame(general_stats_tab)
         memory_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
         memory_label_frame = ttk.Labelframe(memory_frame, text="Memory and Swap", padding=(10, 10))
         memory_label_frame.pack(fill=tk.X, expand=True, padx=5, pady=5)
-        self.memory_usage_treeview = ttk.Treeview(memory_label_frame, columns=('Field', 'Value', 'Graph'), show='', bootstyle='DARK', height=2)
-        self.memory_usage_treeview.heading('Field', text='Field', anchor='w')
-        self.memory_usage_treeview.heading('Value', text='Value', anchor='w')
-        self.memory_usage_treeview.heading('Graph', text='Graph', anchor='w')
-        self.memory_usage_treeview.column('Field', width=100, stretch=tk.NO)
-        self.memory_usage_treeview.column('Value', width=150, stretch=tk.NO)
-        self.memory_usage_treeview.column('Graph', stretch=tk.YES)
-        self.memory_usage_treeview.tag_configure("evenrow", background="#222222")
-        self.memory_usage_treeview.tag_configure("oddrow", background="#303030")
-
-        self.memory_usage_treeview.insert('', tk.END, values=('Memory', ''), tags=("evenrow",))
-        self.memory_usage_treeview.insert('', tk.END, values=('Swap', ''), tags=("oddrow",))
-
-        self.memory_usage_treeview.pack(fill=tk.BOTH, expand=True)
+        self.memory_graph = SparklineGraph(memory_label_frame, height=35, color="#3498db", fill="#1b3a55")
+        self.memory_graph.canvas.pack(fill=tk.X, expand=True, pady=(0, 5))
+        self.swap_graph = SparklineGraph(memory_label_frame, height=35, color="#f39c12", fill="#5a3c0b")
+        self.swap_graph.canvas.pack(fill=tk.X, expand=True)
+
+        # Cria os gráficos de pressure stall (PSI): porcentagem do tempo em stall ("some") por recurso
+        pressure_frame = ttk.Frame(general_stats_tab)
+        pressure_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
+        pressure_label_frame = ttk.Labelframe(pressure_frame, text="Pressure Stall (some / full: avg10 avg60 avg300, now)",
+                                              padding=(10, 10))
+        pressure_label_frame.pack(fill=tk.X, expand=True, padx=5, pady=5)
+        self.pressure_graphs = {}
+        for resource, color, fill in (("cpu", "#00bc8c", "#0b4f40"), ("memory", "#3498db", "#1b3a55"),
+                                      ("io", "#f39c12", "#5a3c0b")):
+            graph = SparklineGraph(pressure_label_frame, height=30, max_value=None, color=color, fill=fill)
+            graph.canvas.pack(fill=tk.X, expand=True, pady=(0, 5))
+            self.pressure_graphs[resource] = graph
+
+        # Cria as tabelas NUMA: memória, alocações e CPU por nó, e placement dos processos de maior RSS
+        numa_frame = ttk.Frame(general_stats_tab)
+        numa_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
+        numa_label_frame = ttk.Labelframe(numa_frame, text="NUMA Nodes", padding=(10, 10))
+        numa_label_frame.pack(fill=tk.X, expand=True, padx=5, pady=5)
+        self.numa_treeview = ttk.Treeview(numa_label_frame, columns=('Node', 'CPUs', 'CPU', 'Memory', 'Local', 'Remote'),
+                                          show='headings', bootstyle='DARK', height=3)
+        for column, text, width in (('Node', 'Node', 60), ('CPUs', 'CPUs', 60), ('CPU', 'CPU(%)', 80),
+                                    ('Memory', 'Memory Used', 160), ('Local', 'Local Allocs', 100),
+                                    ('Remote', 'Remote Allocs', 110)):
+            self.numa_treeview.heading(column, text=text, anchor='w')
+            self.numa_treeview.column(column, width=width)
+        self.numa_treeview.tag_configure("evenrow", background="#222222")
+        self.numa_treeview.tag_configure("oddrow", background="#303030")
+        self.numa_treeview.grid(row=0, column=0, sticky='nsew', padx=(0, 5))
+        self.numa_processes_treeview = ttk.Treeview(numa_label_frame, columns=('PID', 'Name', 'Placement'),
+                                                    show='headings', bootstyle='DARK', height=3)
+        for column, width in (('PID', 70), ('Name', 130), ('Placement', 260)):
+            self.numa_processes_treeview.heading(column, text=column, anchor='w')
+            self.numa_processes_treeview.column(column, width=width)
+        self.numa_processes_treeview.tag_configure("evenrow", background="#222222")
+        self.numa_processes_treeview.tag_configure("oddrow", background="#303030")
+        self.numa_processes_treeview.grid(row=0, column=1, sticky='nsew')
+        numa_label_frame.grid_columnconfigure(0, weight=1)
+        numa_label_frame.grid_columnconfigure(1, weight=1)
 
         # Cria a tabela de outros dados gerais do sistema
         general_stats_frame = ttk.Frame(general_stats_tab)
@@ -145,21 +262,149 @@ class View:
         general_stats_label_frame = ttk.Labelframe(general_stats_frame, text="Other System Stats", padding=(10, 10))
         general_stats_label_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.general_stats_treeview = ttk.Treeview(general_stats_label_frame,
-                                                  columns=('Field', 'Value'), show='', bootstyle='DARK', height=4)
+                                                  columns=('Field', 'Value'), show='', bootstyle='DARK', height=6)
         self.general_stats_treeview.heading('Field', text='Field', anchor='w')
         self.general_stats_treeview.heading('Value', text='Value', anchor='w')
-        self.general_stats_treeview.column('Field', width=150)
+        self.general_stats_treeview.column('Field', width=280)
         self.general_stats_treeview.column('Value', width=100)
         self.general_stats_treeview.tag_configure("evenrow", background="#222222")
         self.general_stats_treeview.tag_configure("oddrow", background="#303030")
 
-        fields = ['Number of Processes', 'Number of Threads', 'Load Average', 'Uptime']
+        fields = ['Number of Processes', 'Number of Threads', 'Load Average', 'Uptime',
+                  'TCP Sockets (est/listen/close-wait/time-wait)', 'UDP / Unix Sockets']
         for field in fields:
             self.general_stats_treeview.insert('', tk.END, values=(field, ''), 
                                           tags=("evenrow" if fields.index(field) % 2 == 0 else "oddrow",))
         
         self.general_stats_treeview.pack(fill=tk.BOTH, expand=True)
 
+        # Cria a tabela de I/O (discos e interfaces de rede)
+        io_frame = ttk.Frame(general_stats_tab)
+        io_frame.pack(side=tk.TOP, fill=tk.BOTH, padx=10, pady=10)
+        io_label_frame = ttk.Labelframe(io_frame, text="Disk and Network I/O", padding=(10, 10))
+        io_label_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.io_treeview = ttk.Treeview(io_label_frame, columns=('Device', 'Read', 'Write'),
+                                        show='headings', bootstyle='DARK', height=4)
+        self.io_treeview.heading('Device', text='Device', anchor='w')
+        self.io_treeview.heading('Read', text='Read / RX', anchor='w')
+        self.io_treeview.heading('Write', text='Write / TX', anchor='w')
+        self.io_treeview.column('Device', width=150)
+        self.io_treeview.column('Read', width=100)
+        self.io_treeview.column('Write', width=100)
+        self.io_treeview.tag_configure("evenrow", background="#222222")
+        self.io_treeview.tag_configure("oddrow", background="#303030")
+
+        self.io_treeview.pack(fill=tk.BOTH, expand=True)
+
+    def create_cgroups_tab(self):
+        """
+        Cria a aba para mostrar o uso de recursos agregado por cgroup (containers, pods, slices do systemd).
+        Cada cgroup pode ser expandido para mostrar os cgroups filhos e os processos membros.
+        """
+        cgroups_tab = ttk.Frame(self.notebook)
+        self.notebook.add(cgroups_tab, text="Containers / Slices")
+
+        self.cgroups_tree = ttk.Treeview(cgroups_tab, columns=('CPU', 'Memory', 'Anon', 'File', 'Read', 'Write', 'Procs',
+                                                               'CPUPSI', 'MemPSI', 'IOPSI'),
+                                         show='tree headings', bootstyle='DARK')
+        self.cgroups_tree.heading('#0', text='cgroup', anchor='w')
+        self.cgroups_tree.heading('CPU', text='CPU(%)', anchor='w')
+        self.cgroups_tree.heading('Memory', text='Memory', anchor='w')
+        self.cgroups_tree.heading('Anon', text='Anon', anchor='w')
+        self.cgroups_tree.heading('File', text='File', anchor='w')
+        self.cgroups_tree.heading('Read', text='Read', anchor='w')
+        self.cgroups_tree.heading('Write', text='Write', anchor='w')
+        self.cgroups_tree.heading('Procs', text='Processes', anchor='w')
+        self.cgroups_tree.heading('CPUPSI', text='CPU Stall', anchor='w')
+        self.cgroups_tree.heading('MemPSI', text='Mem Stall (some/full)', anchor='w')
+        self.cgroups_tree.heading('IOPSI', text='IO Stall (some/full)', anchor='w')
+        self.cgroups_tree.column('#0', width=330)
+        self.cgroups_tree.column('CPU', width=80)
+        self.cgroups_tree.column('Memory', width=100)
+        self.cgroups_tree.column('Anon', width=100)
+        self.cgroups_tree.column('File', width=100)
+        self.cgroups_tree.column('Read', width=100)
+        self.cgroups_tree.column('Write', width=100)
+        self.cgroups_tree.column('Procs', width=80)
+        self.cgroups_tree.column('CPUPSI', width=80)
+        self.cgroups_tree.column('MemPSI', width=140)
+        self.cgroups_tree.column('IOPSI', width=140)
+        self.cgroups_tree.tag_configure("evenrow", background="#222222")
+        self.cgroups_tree.tag_configure("oddrow", background="#303030")
+
+        scrollbar = ttk.Scrollbar(cgroups_tab, orient=tk.VERTICAL, command=self.cgroups_tree.yview)
+        self.cgroups_tree.configure(yscroll=scrollbar.set)
+        self.cgroups_tree.grid(row=0, column=0, sticky='nsew')
+        scrollbar.grid(row=0, column=1, sticky='ns')
+
+        cgroups_tab.grid_columnconfigure(0, weight=1)
+        cgroups_tab.grid_rowconfigure(0, weight=1)
+
+        # Bind dos eventos de expandir/colapsar (drill-down nos processos membros)
+        self.cgroups_tree.bind('<<TreeviewOpen>>', lambda event: self.toggle_cgroup_row(event, opened=True))
+        self.cgroups_tree.bind('<<TreeviewClose>>', lambda event: self.toggle_cgroup_row(event, opened=False))
+
+    def create_hot_threads_tab(self):
+        """
+        Cria a aba para mostrar as threads com maior uso de CPU de todo o sistema (e o processo de cada uma).
+        """
+        hot_threads_tab = ttk.Frame(self.notebook)
+        self.notebook.add(hot_threads_tab, text="Hot Threads")
+
+        self.hot_threads_label = ttk.Label(hot_threads_tab, text="Collecting data...")
+        self.hot_threads_label.grid(row=0, column=0, columnspan=2, sticky='w', padx=5, pady=5)
+
+        columns = ('TID', 'Thread', 'PID', 'Process', 'User', 'CPU', 'State')
+        self.hot_threads_tree = ttk.Treeview(hot_threads_tab, columns=columns, show='headings', bootstyle='DARK')
+        for column in columns:
+            self.hot_threads_tree.heading(column, text='CPU(%)' if column == 'CPU' else column, anchor='w')
+        self.hot_threads_tree.column('TID', width=80)
+        self.hot_threads_tree.column('Thread', width=200)
+        self.hot_threads_tree.column('PID', width=80)
+        self.hot_threads_tree.column('Process', width=200)
+        self.hot_threads_tree.column('User', width=100)
+        self.hot_threads_tree.column('CPU', width=80)
+        self.hot_threads_tree.column('State', width=100)
+        self.hot_threads_tree.tag_configure("evenrow", background="#222222")
+        self.hot_threads_tree.tag_configure("oddrow", background="#303030")
+
+        scrollbar = ttk.Scrollbar(hot_threads_tab, orient=tk.VERTICAL, command=self.hot_threads_tree.yview)
+        self.hot_threads_tree.configure(yscroll=scrollbar.set)
+        self.hot_threads_tree.grid(row=1, column=0, sticky='nsew')
+        scrollbar.grid(row=1, column=1, sticky='ns')
+
+        hot_threads_tab.grid_columnconfigure(0, weight=1)
+        hot_threads_tab.grid_rowconfigure(1, weight=1)
+
+    def create_short_lived_tab(self):
+        """
+        Cria a aba para mostrar os processos de vida curta encerrados recentemente, agrupados pelo nome.
+        """
+        short_lived_tab = ttk.Frame(self.notebook)
+        self.notebook.add(short_lived_tab, text="Recently Exited")
+
+        self.short_lived_label = ttk.Label(short_lived_tab, text="Collecting data...")
+        self.short_lived_label.grid(row=0, column=0, columnspan=2, sticky='w', padx=5, pady=5)
+
+        self.short_lived_tree = ttk.Treeview(short_lived_tab, columns=('Name', 'Exits', 'CPU'), show='headings',
+                                             bootstyle='DARK')
+        self.short_lived_tree.heading('Name', text='Name', anchor='w')
+        self.short_lived_tree.heading('Exits', text='Exited', anchor='w')
+        self.short_lived_tree.heading('CPU', text='CPU Time (s)', anchor='w')
+        self.short_lived_tree.column('Name', width=250)
+        self.short_lived_tree.column('Exits', width=100)
+        self.short_lived_tree.column('CPU', width=100)
+        self.short_lived_tree.tag_configure("evenrow", background="#222222")
+        self.short_lived_tree.tag_configure("oddrow", background="#303030")
+
+        scrollbar = ttk.Scrollbar(short_lived_tab, orient=tk.VERTICAL, command=self.short_lived_tree.yview)
+        self.short_lived_tree.configure(yscroll=scrollbar.set)
+        self.short_lived_tree.grid(row=1, column=0, sticky='nsew')
+        scrollbar.grid(row=1, column=1, sticky='ns')
+
+        short_lived_tab.grid_columnconfigure(0, weight=1)
+        short_lived_tab.grid_rowconfigure(1, weight=1)
+
     def create_specific_process_tab(self, event):
         """
         Cria uma aba para mostrar os detalhes de um processo específico.
@@ -193,30 +438,43 @@ class View:
 
         proc_label_frame = ttk.Labelframe(left_frame, text="Process data", padding=(10, 10))
         proc_label_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        process_data_treeview = ttk.Treeview(proc_label_frame, columns=('Field', 'Value'), show='', bootstyle='DARK', height=10)
+        process_data_treeview = ttk.Treeview(proc_label_frame, columns=('Field', 'Value'), show='', bootstyle='DARK', height=22)
         process_data_treeview.tag_configure("evenrow", background="#222222")
         process_data_treeview.tag_configure("oddrow", background="#303030")
         fields = ['PPID', 'Name', 'Username', 'CPU(%)', 'Status', 'Number of Threads',
-                  'Priority', 'Nice', 'Processor Time', 'Command']
+                  'Priority', 'Nice', 'Processor Time', 'Command', 'Disk Read', 'Disk Write',
+                  'Read Syscalls', 'Write Syscalls', 'Last CPU', 'CPU Affinity', 'On-CPU / Run-queue Wait',
+                  'Timeslices', 'Context Switches (vol/invol)', 'Open File Descriptors',
+                  'TCP Sockets (est/listen/close-wait/other)', 'UDP / Unix Sockets']
         for idx, field in enumerate(fields):
             process_data_treeview.insert('', tk.END, values=(field, ''), tags=("evenrow" if idx % 2 == 0 else "oddrow",))
         
         proc_mem_label_frame = ttk.Labelframe(left_frame, text="Memory Usage", padding=(10, 10))
         proc_mem_label_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
-        process_mem_treeview = ttk.Treeview(proc_mem_label_frame, columns=('Field', 'Value'), show='', bootstyle='DARK', height=6)
+        process_mem_treeview = ttk.Treeview(proc_mem_label_frame, columns=('Field', 'Value'), show='', bootstyle='DARK', height=10)
         process_mem_treeview.tag_configure("evenrow", background="#222222")
         process_mem_treeview.tag_configure("oddrow", background="#303030")
         mem_fields = ['Virtual Memory', 'Resident Memory', 'Shared Memory',
-                      'Text Segment Size', 'Data Segment Size', 'Stack Segment Size']
+                      'Text Segment Size', 'Data Segment Size', 'Stack Segment Size',
+                      'Proportional (PSS)', 'Unique (USS)', 'Swap', 'NUMA Placement']
         for idx, field in enumerate(mem_fields):
             process_mem_treeview.insert('', tk.END, values=(field, ''), 
                                         tags=("evenrow" if idx % 2 == 0 else "oddrow",))
         
+        # Gráficos de histórico de CPU e memória residente do processo
+        history_label_frame = ttk.Labelframe(left_frame, text="History", padding=(10, 10))
+        history_label_frame.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
+        cpu_graph = SparklineGraph(history_label_frame, height=40)
+        cpu_graph.canvas.pack(fill=tk.X, expand=True, pady=(0, 5))
+        rss_graph = SparklineGraph(history_label_frame, height=40, max_value=None, color="#3498db", fill="#1b3a55")
+        rss_graph.canvas.pack(fill=tk.X, expand=True)
+
         left_frame.grid_columnconfigure(0, weight=1)
         left_frame.grid_rowconfigure(0, weight=1)
 
-        # Armazenar as treeviews para atualizações futuras
+        # Armazenar as treeviews e gráficos para atualizações futuras
         self.process_data_treeviews[details_tab] = (process_data_treeview, process_mem_treeview)
+        self.process_graphs[details_tab] = (cpu_graph, rss_graph)
 
 
         # Criar a tabela de threads
@@ -226,7 +484,8 @@ class View:
         thr_label_frame = ttk.Labelframe(right_frame, text="Threads", padding=(10, 10))
         thr_label_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
 
-        threads_treeview = ttk.Treeview(thr_label_frame,columns=('TID', 'Name', 'User', 'Mem', 'CPU', 'State'), 
+        threads_treeview = ttk.Treeview(thr_label_frame,columns=('TID', 'Name', 'User', 'Mem', 'CPU', 'State', 'LastCPU',
+                                                                 'Run', 'Wait', 'Slices', 'Vol', 'Invol', 'Affinity'), 
                                                         show='headings', bootstyle='DARK', height=28)
         threads_treeview.heading('TID', text='TID', anchor='w')
         threads_treeview.heading('Name', text='Name', anchor='w')
@@ -234,12 +493,26 @@ class View:
         threads_treeview.heading('Mem', text='Memory', anchor='w')
         threads_treeview.heading('CPU', text='CPU(%)', anchor='w')
         threads_treeview.heading('State', text='State', anchor='w')
+        threads_treeview.heading('LastCPU', text='Last CPU', anchor='w')
+        threads_treeview.heading('Run', text='On-CPU (ms/s)', anchor='w')
+        threads_treeview.heading('Wait', text='RQ Wait (ms/s)', anchor='w')
+        threads_treeview.heading('Slices', text='Slices/s', anchor='w')
+        threads_treeview.heading('Vol', text='Vol CS/s', anchor='w')
+        threads_treeview.heading('Invol', text='Invol CS/s', anchor='w')
+        threads_treeview.heading('Affinity', text='Affinity', anchor='w')
         threads_treeview.column('TID', width=60)
         threads_treeview.column('Name', width=130)
         threads_treeview.column('User', width=100)
         threads_treeview.column('Mem', width=90)
         threads_treeview.column('CPU', width=65)
         threads_treeview.column('State', width=100)
+        threads_treeview.column('LastCPU', width=65)
+        threads_treeview.column('Run', width=95)
+        threads_treeview.column('Wait', width=95)
+        threads_treeview.column('Slices', width=65)
+        threads_treeview.column('Vol', width=65)
+        threads_treeview.column('Invol', width=70)
+        threads_treeview.column('Affinity', width=80)
         threads_treeview.tag_configure("evenrow", background="#222222")
         threads_treeview.tag_configure("oddrow", background="#303030")
 
@@ -260,7 +533,8 @@ class View:
     ##########################################
     # Métodos para atualizar os dados da GUI #
     ##########################################
-    def update_data(self, processes_data, specific_process_data, general_stats_data):
+    def update_data(self, processes_data, specific_process_data, general_stats_data, cgroups_data=None,
+                    hot_threads_data=None, short_lived_data=None, pressure_data=None):
         """
         Atualiza todos os dados na view.
         Chamado periodicamente no controller para atualizar os dados exibidos na GUI.
@@ -269,6 +543,16 @@ class View:
         self.process_data_dict = processes_data
         self.specific_process_data_dict = specific_process_data
         self.general_stats_data = general_stats_data
+        self.cgroups_data = cgroups_data
+        if hot_threads_data:
+            # O ranking chega em intervalo variável: guarda o último para mostrar ao trocar de aba
+            self.hot_threads_data = hot_threads_data
+        self.short_lived_data = short_lived_data
+        self.pressure_data = pressure_data
+        if processes_data:
+            self.latest_process_data = processes_data
+        if general_stats_data:
+            self.latest_general_stats_data = general_stats_data
 
         # Pega a aba ativa do notebook
         active_tab = self.notebook.select()
@@ -278,11 +562,29 @@ class View:
             # Se a aba ativa for a lista de processos, atualiza a view
             self.update_process_list_view(list(self.process_data_dict.values()))
         
+        # Os gráficos acumulam histórico mesmo com a aba inativa (cada tick só acrescenta um segmento)
+        if self.general_stats_data and self.deferred_tabs_created:
+            self.update_general_stats_graphs(self.general_stats_data)
+        if self.pressure_data and self.deferred_tabs_created:
+            self.update_pressure_graphs(self.pressure_data)
+
         # Atualiza a aba de dados gerais do sistema
-        if active_tab == self.notebook.tabs()[1] and self.general_stats_data:
+        if self.deferred_tabs_created and active_tab == self.notebook.tabs()[1] and self.general_stats_data:
             # Se a aba ativa for a aba de dados gerais do sistema, atualiza a view
             self.update_general_stats_view(self.general_stats_data)
 
+        # Atualiza a aba de cgroups
+        if self.deferred_tabs_created and active_tab == self.notebook.tabs()[2] and self.cgroups_data:
+            self.update_cgroups_view(self.cgroups_data)
+
+        # Atualiza a aba de hot threads
+        if self.deferred_tabs_created and active_tab == self.notebook.tabs()[3] and self.hot_threads_data:
+            self.update_hot_threads_view(self.hot_threads_data)
+
+        # Atualiza a aba de processos de vida curta
+        if self.deferred_tabs_created and active_tab == self.notebook.tabs()[4] and self.short_lived_data:
+            self.update_short_lived_view(self.short_lived_data)
+
         # Checa as abas abertas dos processos especificos
         if self.specific_process_data_dict and self.processes_opened_tabs:
             # Copia o dict para evitar problemas de iteração durante a atualização
@@ -290,10 +592,12 @@ class View:
             for pid, tab_id in opened_tabs.items():
                 # Verifica se a entry no dict não é vazia (pode ser uma chave que existe, mas com tupla vazia)
                 # Se a entrada for uma tupla vazia, significa que o processo foi adicionado mas ainda não recebeu dados, então espera
-                if str(active_tab) == str(tab_id) and pid in self.specific_process_data_dict and self.specific_process_data_dict[pid]:
-                    # Se a entry for uma tupla com dados, atualiza a aba
+                if pid in self.specific_process_data_dict and self.specific_process_data_dict[pid]:
+                    # Se a entry for uma tupla com dados, atualiza os gráficos e, se a aba estiver ativa, as tabelas
                     if all(data is not None for data in self.specific_process_data_dict[pid]):
-                        self.update_specific_process_tab(tab_id, self.specific_process_data_dict[pid])
+                        self.update_specific_process_graphs(tab_id, self.specific_process_data_dict[pid])
+                        if str(active_tab) == str(tab_id):
+                            self.update_specific_process_tab(tab_id, self.specific_process_data_dict[pid])
                     else:
                         # Se a entry for uma tupla com dados None, significa que o processo foi terminado (confirmado pelo Model)
                         self.close_tab(tab_id, pid, req=True)
@@ -314,10 +618,20 @@ class View:
         for item in self.process_list_tree.get_children():
             self.process_list_tree.delete(item)
 
+        # Ordenar pela coluna escolhida no cabeçalho
+        if self.process_sort_column:
+            key = self.PROCESS_SORT_KEYS[self.process_sort_column]
+            process_data = sorted(process_data, key=lambda process: self.sort_key(key(process)),
+                                  reverse=self.process_sort_reverse)
+
         # Inserir novos dados na treeview
         for idx, process in enumerate(process_data):
             self.process_list_tree.insert('', tk.END, values=(process[0], process[1], process[2], process[3], 
-                                                              process[4], f"{process[5]:.2f}%", process[6]),
+                                                              process[4], f"{process[5]:.2f}%", process[6],
+                                                              self.format_rate(process[7]), self.format_rate(process[8]),
+                                                              process[9], process[10], process[11], process[13],
+                                                              sum(process[14]) if process[14] else "N/A",
+                                                              self.format_growth(process[15])),
                                           tags=("evenrow" if idx % 2 == 0 else "oddrow",))
             # Se o processo selecionado for o mesmo que o texto selecionado, manter a seleção
             if selected_text and process[0] == selected_text['values'][0]:
@@ -327,6 +641,85 @@ class View:
                 
         # Atualizar a posição de rolagem
         self.process_list_tree.yview_moveto(current_position)
+        self.report_visible_processes()
+
+    def sort_process_list(self, column):
+        """
+        Ordena a lista de processos pela coluna clicada (um segundo clique inverte a ordem).
+        Colunas numéricas começam em ordem decrescente.
+        """
+        if self.process_sort_column == column:
+            self.process_sort_reverse = not self.process_sort_reverse
+        else:
+            self.process_sort_column = column
+            self.process_sort_reverse = column not in ('Name', 'User', 'State')
+        if self.latest_process_data:
+            self.update_process_list_view(list(self.latest_process_data.values()))
+
+    def sort_key(self, value):
+        """
+        Chave de ordenação que não mistura números e texto ("N/A" fica sempre depois dos números).
+        """
+        if isinstance(value, (int, float)):
+            return (1, value, "")
+        return (0, 0, str(value).lower())
+
+    def report_visible_processes(self):
+        """
+        Informa ao Model quais PIDs estão visíveis na lista de processos (só quando mudam).
+        """
+        children = self.process_list_tree.get_children()
+        if not children:
+            return
+        top, bottom = self.process_list_tree.yview()
+        first = int(top * len(children))
+        last = int(bottom * len(children)) + 1
+        visible = [self.process_list_tree.item(child)['values'][0] for child in children[first:last]]
+        if visible != self.visible_pids:
+            self.visible_pids = visible
+            self.specific_process_req_queue.put((visible, 'visible'))
+
+    def update_general_stats_graphs(self, general_data):
+        """
+        Acrescenta os valores atuais aos gráficos de CPU (total e heatmap por CPU lógica), memória e swap.
+        """
+        total_cpu_usage = general_data[6][0][1]
+        self.total_cpu_graph.append(total_cpu_usage, f"Total CPU  {total_cpu_usage:.2f}%")
+        if self.cpu_usage_expanded:
+            self.update_cpu_heatmap()
+
+        self.memory_graph.append(general_data[2], f"Memory  {general_data[1]}/{general_data[0]}  ({general_data[2]:.2f}%)")
+        self.swap_graph.append(general_data[5], f"Swap  {general_data[4]}/{general_data[3]}  ({general_data[5]:.2f}%)")
+
+    def update_pressure_graphs(self, pressure_data):
+        """
+        Acrescenta a taxa de stall atual de cada recurso aos gráficos de PSI (o texto mostra as médias do kernel).
+        """
+        for resource, graph in self.pressure_graphs.items():
+            if resource not in pressure_data:
+                continue
+            some10, some60, some300, some_rate, full10, full60, full300, full_rate = pressure_data[resource]
+            graph.append(some_rate, f"{resource.upper()}  some {some10:.2f} {some60:.2f} {some300:.2f}, {some_rate:.2f}%"
+                                    f"  ·  full {full10:.2f} {full60:.2f} {full300:.2f}, {full_rate:.2f}%")
+
+    def update_cpu_heatmap(self):
+        """
+        Atualiza o heatmap de uso por CPU lógica, agrupando por socket ou nó NUMA conforme selecionado.
+        (Só as células que mudaram de faixa de cor são repintadas.)
+        """
+        if not self.latest_general_stats_data:
+            return
+        cores_cpu_usage = self.latest_general_stats_data[6][1:]
+        topology = self.latest_general_stats_data[14]
+        grouping = self.cpu_grouping.get()
+        if grouping == "No grouping":
+            self.cpu_heatmap.update(cores_cpu_usage)
+            return
+        position, prefix = (0, "Socket") if grouping == "Socket" else (1, "Node")
+        # Ordena as CPUs pelo grupo (mantendo a ordem original dentro de cada grupo)
+        keyed = sorted(((topology.get(name, (0, 0))[position], idx) for idx, (name, _) in enumerate(cores_cpu_usage)))
+        self.cpu_heatmap.update([cores_cpu_usage[idx] for _, idx in keyed],
+                                [f"{prefix} {group}" for group, _ in keyed])
 
     def update_general_stats_view(self, general_data):
         """
@@ -336,53 +729,175 @@ class View:
             return
         
         # Limpar dados existentes nas treeviews
-        for item in self.cpu_usage_treeview.get_children():
-            self.cpu_usage_treeview.delete(item)
-        for item in self.memory_usage_treeview.get_children():
-            self.memory_usage_treeview.delete(item)
         for item in self.general_stats_treeview.get_children():
             self.general_stats_treeview.delete(item)
-
-        # Atualizar a tabela de uso de CPU
-        total_cpu_usage = general_data[6][0][1]
-        cores_cpu_usage = general_data[6][1:]
-        self.cpu_usage_treeview.insert('', tk.END, values=(('▾' if self.cpu_usage_expanded else '▸') + '  Total CPU', 
-                                                           f"{total_cpu_usage:.2f}%", self.plot_graph_string(100, total_cpu_usage)),
-                                       tags=("evenrow",))
-        # Adicionar uso de CPU por núcleo
-        if self.cpu_usage_expanded:
-            for idx, usage in enumerate(cores_cpu_usage):
-                self.cpu_usage_treeview.insert('', tk.END, values=(f"        Core {idx}", f"    {usage[1]:.2f}%", self.plot_graph_string(100, usage[1])),
-                                               tags=("oddrow" if idx % 2 == 0 else "evenrow",))
-        
-        self.cpu_usage_treeview.pack(fill=tk.BOTH, expand=True)
-
-        # Atualizar a tabela de uso de memória
-        total_memory = general_data[0]
-        used_memory = general_data[1]
-        memory_usage = general_data[2]
-        total_swap = general_data[3]
-        used_swap = general_data[4]
-        swap_usage = general_data[5]
-        self.memory_usage_treeview.insert('', tk.END, values=('Memory', used_memory + "/" + total_memory, 
-                                                              self.plot_graph_string(100, memory_usage)), 
-                                                              tags=("evenrow",))
-        self.memory_usage_treeview.insert('', tk.END, values=('Swap', used_swap + "/" + total_swap, 
-                                                              self.plot_graph_string(100, swap_usage)), 
-                                                              tags=("oddrow",))
-
-        self.memory_usage_treeview.pack(fill=tk.BOTH, expand=True)
+        for item in self.io_treeview.get_children():
+            self.io_treeview.delete(item)
 
         # Atualizar a tabela de outros dados gerais do sistema
-        fields = ['Number of Processes', 'Number of Threads', 'Load Average', 'Uptime']
+        fields = ['Number of Processes', 'Number of Threads', 'Load Average', 'Uptime',
+                  'TCP Sockets (est/listen/close-wait/time-wait)', 'UDP / Unix Sockets']
         values = [general_data[7], general_data[8], f"{general_data[9][0]:.2f}, {general_data[9][1]:.2f}, {general_data[9][2]:.2f}",
                   general_data[10]]
+        if general_data[17]:
+            # TIME_WAIT só existe no total do sistema (o socket não pertence mais a nenhum processo)
+            established, listen, close_wait, _, udp, unix, time_wait = general_data[17]
+            values += [f"{established} / {listen} / {close_wait} / {time_wait}", f"{udp} / {unix}"]
+        else:
+            values += ["N/A", "N/A"]
         for field, value in zip(fields, values):
             self.general_stats_treeview.insert('', tk.END, values=(field, value), 
                                                tags=("evenrow" if fields.index(field) % 2 == 0 else "oddrow",))
 
         self.general_stats_treeview.pack(fill=tk.BOTH, expand=True)
 
+        # Atualizar a tabela de I/O (discos e depois interfaces de rede)
+        for idx, (device, read_rate, write_rate) in enumerate(general_data[11] + general_data[12]):
+            self.io_treeview.insert('', tk.END, values=(device, self.format_rate(read_rate), self.format_rate(write_rate)),
+                                    tags=("evenrow" if idx % 2 == 0 else "oddrow",))
+
+        self.io_treeview.pack(fill=tk.BOTH, expand=True)
+
+        # Atualizar as tabelas NUMA
+        numa_nodes, numa_processes = general_data[15], general_data[16]
+        for item in self.numa_treeview.get_children():
+            self.numa_treeview.delete(item)
+        for idx, (node, num_cpus, cpu_usage, total_kb, used_kb, local_ratio, remote_rate) in enumerate(numa_nodes):
+            usage = 100.0 * used_kb / total_kb if total_kb else 0.0
+            self.numa_treeview.insert('', tk.END, values=(node, num_cpus, f"{cpu_usage:.2f}%",
+                                                          f"{self.format_kb(used_kb)}/{self.format_kb(total_kb)} ({usage:.1f}%)",
+                                                          f"{local_ratio:.1f}%" if local_ratio is not None else "N/A",
+                                                          f"{remote_rate:.1f} pages/s"),
+                                      tags=("evenrow" if idx % 2 == 0 else "oddrow",))
+        for item in self.numa_processes_treeview.get_children():
+            self.numa_processes_treeview.delete(item)
+        for idx, (pid, name, placement) in enumerate(numa_processes):
+            self.numa_processes_treeview.insert('', tk.END, values=(pid, name, self.format_numa_placement(placement)),
+                                                tags=("evenrow" if idx % 2 == 0 else "oddrow",))
+
+    def format_kb(self, kb):
+        """
+        Formata um valor em KB como MB ou GB.
+        """
+        if kb >= 1024 * 1024:
+            return f"{kb / (1024 * 1024):.2f} GB"
+        return f"{kb / 1024:.2f} MB"
+
+    def format_growth(self, growth):
+        """
+        Formata o crescimento sustentado de memória de um processo (ex.: "+12.00 MB/min, full in 01:02:03").
+        """
+        if not growth:
+            return ""
+        slope, exhaustion = growth
+        text = f"+{self.format_kb(slope * 60)}/min"
+        if exhaustion is not None:
+            hours, rest = divmod(int(exhaustion), 3600)
+            text += f", full in {hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
+        return text
+
+    def format_files(self, files):
+        """
+        Formata os descritores de arquivo e os sockets de um processo (linhas da tabela de dados do processo).
+        """
+        fd_count, sockets = files
+        if not sockets:
+            return [fd_count, "N/A", "N/A"]
+        established, listen, close_wait, other, udp, unix = sockets
+        return [fd_count, f"{established} / {listen} / {close_wait} / {other}", f"{udp} / {unix}"]
+
+    def format_numa_placement(self, placement):
+        """
+        Formata a distribuição da memória de um processo entre os nós NUMA (ex.: "N0 1.20 GB (80%) · N1 ...").
+        """
+        if not placement:
+            return "N/A"
+        total = sum(kb for _, kb in placement) or 1
+        return "  ·  ".join(f"N{node} {self.format_kb(kb)} ({100.0 * kb / total:.0f}%)" for node, kb in placement)
+
+    def update_hot_threads_view(self, hot_threads_data):
+        """
+        Atualiza a aba de hot threads com o último ranking (só redesenha se o ranking mudou).
+        """
+        threads, scanned, cost, interval = hot_threads_data
+        if hot_threads_data is self.last_hot_threads_data:
+            return
+        self.last_hot_threads_data = hot_threads_data
+        self.hot_threads_label.configure(
+            text=f"{scanned} threads scanned in {cost * 1000:.0f} ms  ·  next scan in {interval:.1f} s")
+
+        for item in self.hot_threads_tree.get_children():
+            self.hot_threads_tree.delete(item)
+        for idx, (tid, name, pid, process_name, username, cpu_usage, status) in enumerate(threads):
+            self.hot_threads_tree.insert('', tk.END, values=(tid, name, pid, process_name, username,
+                                                              f"{cpu_usage:.2f}%", status),
+                                         tags=("evenrow" if idx % 2 == 0 else "oddrow",))
+
+    def update_short_lived_view(self, short_lived_data):
+        """
+        Atualiza a aba de processos de vida curta com o resumo atual.
+        """
+        rows, forks_rate, missed = short_lived_data
+        self.short_lived_label.configure(
+            text=f"{forks_rate:.1f} forks/s  ·  {missed} exited before being seen (last minute)")
+
+        for item in self.short_lived_tree.get_children():
+            self.short_lived_tree.delete(item)
+        for idx, (name, exits, cpu_seconds) in enumerate(rows):
+            self.short_lived_tree.insert('', tk.END, values=(name, exits, f"{cpu_seconds:.2f}"),
+                                         tags=("evenrow" if idx % 2 == 0 else "oddrow",))
+
+    def update_cgroups_view(self, cgroups_data):
+        """
+        Atualiza a aba de cgroups com os dados atuais.
+        Os processos membros só são inseridos para os cgroups expandidos.
+        """
+        if not cgroups_data:
+            return
+        self.last_cgroups_data = cgroups_data
+
+        current_position = self.cgroups_tree.yview()[0]
+        for item in self.cgroups_tree.get_children():
+            self.cgroups_tree.delete(item)
+
+        for idx, (path, cpu_usage, memory, anon, file, read_rate, write_rate, pids, pressure) in enumerate(cgroups_data):
+            cpu_some, memory_some, memory_full, io_some, io_full = pressure
+            parent = path.rsplit('/', 1)[0] or '/'
+            if path == '/' or not self.cgroups_tree.exists(parent):
+                parent = ''
+            self.cgroups_tree.insert(parent, tk.END, iid=path, text=path if parent == '' else path.rsplit('/', 1)[1],
+                                     values=(f"{cpu_usage:.2f}%", memory, anon, file, self.format_rate(read_rate),
+                                             self.format_rate(write_rate), len(pids), f"{cpu_some:.2f}%",
+                                             f"{memory_some:.2f}% / {memory_full:.2f}%", f"{io_some:.2f}% / {io_full:.2f}%"),
+                                     open=path in self.opened_cgroups,
+                                     tags=("evenrow" if idx % 2 == 0 else "oddrow",))
+            if path not in self.opened_cgroups:
+                if pids:
+                    # Filho vazio só para mostrar a seta de expandir
+                    self.cgroups_tree.insert(path, tk.END, iid=f"{path}:", text='')
+                continue
+            # Drill-down: processos membros
+            for pid in pids:
+                process = self.latest_process_data.get(pid)
+                if not process:
+                    continue
+                self.cgroups_tree.insert(path, tk.END, iid=f"{path}:{pid}", text=f"{pid}  {process[1]}",
+                                         values=(f"{process[5]:.2f}%", process[4], '', '', self.format_rate(process[7]),
+                                                 self.format_rate(process[8]), ''),
+                                         tags=("oddrow" if idx % 2 == 0 else "evenrow",))
+
+        self.cgroups_tree.yview_moveto(current_position)
+
+    def update_specific_process_graphs(self, tab_id, process_data):
+        """
+        Acrescenta o uso de CPU e a memória residente atuais aos gráficos de histórico da aba do processo.
+        """
+        if tab_id not in self.process_graphs:
+            return
+        cpu_graph, rss_graph = self.process_graphs[tab_id]
+        cpu_graph.append(process_data[4], f"CPU  {process_data[4]:.2f}%")
+        rss_graph.append(process_data[25], f"Resident Memory  {process_data[12]}")
+
     def update_specific_process_tab(self, tab_id, process_data):
         """
         Atualiza a aba de processo específico com os dados atuais.
@@ -401,10 +916,18 @@ class View:
 
         # Inserir novos dados na treeview de dados do processo
         fields = ['PPID', 'Name', 'Username', 'CPU(%)', 'Status', 'Number of Threads',
-                  'Priority', 'Nice', 'Processor Time', 'Command']
+                  'Priority', 'Nice', 'Processor Time', 'Command', 'Disk Read', 'Disk Write',
+                  'Read Syscalls', 'Write Syscalls', 'Last CPU', 'CPU Affinity', 'On-CPU / Run-queue Wait',
+                  'Timeslices', 'Context Switches (vol/invol)', 'Open File Descriptors',
+                  'TCP Sockets (est/listen/close-wait/other)', 'UDP / Unix Sockets']
+        last_cpu, run_rate, wait_rate, slices_rate, voluntary_rate, involuntary_rate, affinity = process_data[26]
         values = [process_data[1], process_data[2], process_data[3], f"{process_data[4]:.2f}%",
                   process_data[5], process_data[6], process_data[7], process_data[8],
-                  process_data[9], process_data[10]]
+                  process_data[9], process_data[10], self.format_rate(process_data[18]),
+                  self.format_rate(process_data[19]), self.format_rate(process_data[20], "/s"),
+                  self.format_rate(process_data[21], "/s"), last_cpu, affinity,
+                  f"{run_rate:.2f} / {wait_rate:.2f} ms/s", self.format_rate(slices_rate, "/s"),
+                  f"{voluntary_rate:.1f} / {involuntary_rate:.1f} /s"] + self.format_files(process_data[28])
         for idx, (field, value) in enumerate(zip(fields, values)):
             process_data_treeview.insert('', tk.END, values=(field, value), 
                                          tags=("evenrow" if idx % 2 == 0 else "oddrow",))
@@ -412,9 +935,12 @@ class View:
 
         # Inserir novos dados na treeview de uso de memória do processo
         mem_fields = ['Virtual Memory', 'Resident Memory', 'Shared Memory',
-                      'Text Segment Size', 'Data Segment Size', 'Stack Segment Size']
+                      'Text Segment Size', 'Data Segment Size', 'Stack Segment Size',
+                      'Proportional (PSS)', 'Unique (USS)', 'Swap', 'NUMA Placement']
         mem_values = [process_data[11], process_data[12], process_data[13],
-                      process_data[14], process_data[15], process_data[16]]
+                      process_data[14], process_data[15], process_data[16],
+                      process_data[22], process_data[23], process_data[24],
+                      self.format_numa_placement(process_data[27])]
         for idx, (field, value) in enumerate(zip(mem_fields, mem_values)):
             process_mem_treeview.insert('', tk.END, values=(field, value if value is not None else 'N/A'), 
                                         tags=("evenrow" if idx % 2 == 0 else "oddrow",))
@@ -428,7 +954,9 @@ class View:
         # Inserir novos dados na treeview de threads
         for idx, thread in enumerate(process_data[17]):
             threads_treeview.insert('', tk.END, values=(thread[0], thread[1], thread[2], 
-                                                        thread[3], f"{thread[4]:.2f}%", thread[5]), 
+                                                        thread[3], f"{thread[4]:.2f}%", thread[5], thread[6],
+                                                        f"{thread[7]:.2f}", f"{thread[8]:.2f}", f"{thread[9]:.1f}",
+                                                        f"{thread[10]:.1f}", f"{thread[11]:.1f}", thread[12]), 
                                                         tags=("evenrow" if idx % 2 == 0 else "oddrow",))
         threads_treeview.grid(row=1, column=0, sticky='nsew')
 
@@ -442,40 +970,46 @@ class View:
         if req:
             self.specific_process_req_queue.put((pid, 'remove'))
         self.processes_opened_tabs.pop(pid, None)
+        self.process_graphs.pop(tab, None)
         try:
             self.notebook.forget(tab)
         except:
             return
         
-    def toggle_cpu_row(self, event):
-        """
-        Toggle entre expandir e colapsar a linha de uso de CPU.
-        Se a linha de uso de CPU for expandida, insere os dados de uso de CPU por núcleo.
-        """
-        region = self.cpu_usage_treeview.identify_region(event.x, event.y)
-        item = self.cpu_usage_treeview.identify_row(event.y)
-
-        if item and (region == 'cell' or region == 'heading'):
-                # Toggle do estado de expansão da linha de uso de CPU
-                if not self.cpu_usage_expanded:
-                    self.cpu_usage_expanded = True
-                    self.cpu_usage_treeview.item(item, open=True)          
-                else:
-                    self.cpu_usage_expanded = False
-                    # Removeer os filhos da linha de uso de CPU
-                    for child in self.cpu_usage_treeview.get_children(item):
-                        self.cpu_usage_treeview.delete(child)
-                    self.cpu_usage_treeview.item(item, open=False)
-
-    def plot_graph_string(self, total, used, blocks=100):
-        """
-        Gera uma representação em string de um gráfico para uso de memória.
-        """
-        total_blocks = blocks
-        used_blocks = round((used / total) * total_blocks)
-        graph = "▰" * used_blocks + "▱" * (total_blocks - used_blocks)
-        return graph
-                
+    def toggle_cpu_cores(self):
+        """
+        Toggle entre expandir e colapsar o heatmap de uso de CPU por núcleo.
+        """
+        self.cpu_usage_expanded = not self.cpu_usage_expanded
+        if self.cpu_usage_expanded:
+            self.cpu_cores_frame.grid(row=2, column=0, sticky='ew', pady=(5, 0))
+            self.update_cpu_heatmap()
+            self.cpu_cores_button.configure(text="▾  Cores")
+        else:
+            self.cpu_cores_frame.grid_forget()
+            self.cpu_cores_button.configure(text="▸  Cores")
+
+    def toggle_cgroup_row(self, event, opened):
+        """
+        Registra um cgroup expandido/colapsado e redesenha a aba para inserir (ou remover) os processos membros.
+        """
+        item = self.cgroups_tree.focus()
+        if not item or ':' in item:
+            return
+        if opened:
+            self.opened_cgroups.add(item)
+        else:
+            self.opened_cgroups.discard(item)
+        self.update_cgroups_view(self.last_cgroups_data)
+
+    def format_rate(self, value, unit=" MB/s"):
+        """
+        Formata uma taxa numérica (MB/s, syscalls/s) para exibição. Valores não numéricos ("N/A") são mantidos.
+        """
+        if isinstance(value, str):
+            return value
+        return f"{value:.2f}{unit}"
+
     def run(self):
         """
         Mainloop do tkinter para manter a janela aberta.
@@ -0,0 +1,257 @@
+from model import Model
+import asyncio
+import json
+import os
+import queue
+
+class _Client:
+    """
+    Um navegador conectado a um stream SSE.
+    pid é None para o stream principal (lista de processos e dados gerais) ou o PID de uma aba de detalhes.
+    """
+    def __init__(self, pid=None):
+        self.pid = pid
+        # Eventos já serializados; se o navegador não acompanhar, a fila enche e o stream é encerrado
+        # (o EventSource reconecta sozinho e recebe um snapshot completo)
+        self.queue = asyncio.Queue(maxsize=64)
+
+
+class WebDashboard:
+    """
+    Classe WebDashboard para servir o dashboard no navegador, sem precisar de sessão gráfica no host.
+    Um servidor HTTP asyncio local serve a página (static/index.html) e envia os dados por Server-Sent Events.
+    Todos os navegadores compartilham uma única instância do Model (uma coleta por tick, não uma por viewer), e cada
+    evento é calculado e serializado uma vez só: a lista de processos é enviada como delta (só as linhas que mudaram
+    e os PIDs que saíram), os dados gerais e os detalhes de um processo só quando mudam.
+    Opcionalmente também serve o endpoint OpenMetrics (ver exporter.py), alimentado pelas mesmas coletas.
+    """
+    _STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+    _KEEPALIVE = 15     # Segundos sem eventos até mandar um comentário (detecta navegadores desconectados)
+
+    def __init__(self, port=8080, host="127.0.0.1", DT=1, model_options=None, metrics_port=None, metrics_top_n=50):
+        self._address = (host, port)
+        self._DT = DT
+        self._model_options = model_options or {}
+        self._metrics_port = metrics_port
+        self._metrics_top_n = metrics_top_n
+
+        # Queues do Model (mesmo esquema do Controller)
+        self.process_queue = queue.Queue()
+        self.specific_process_queue = queue.Queue()
+        self.specific_process_req_queue = queue.Queue()
+        self.general_stats_queue = queue.Queue()
+        # Queue de cgroups, só usada pelo endpoint de métricas
+        self.cgroups_queue = queue.Queue()
+        self.model = None
+        self.exporter = None
+
+        # Últimos dados publicados (base dos deltas e do snapshot inicial de novos clientes)
+        self._rows = {}
+        self._general_stats = []
+        self._details = {}
+        # Clientes conectados e quantos clientes acompanham cada PID
+        self._clients = set()
+        self._subscriptions = {}
+
+    def run(self):
+        """
+        Inicia o Model e o servidor HTTP. Fica bloqueado até ser interrompido (Ctrl+C).
+        """
+        self.model = Model(self.process_queue, self.specific_process_queue, self.specific_process_req_queue,
+                           self.general_stats_queue, self.cgroups_queue, DT=self._DT, **self._model_options)
+        self.model.start_processes_thread()
+        self.model.start_specific_processes_thread()
+        self.model.start_general_stats_thread()
+        if self._metrics_port:
+            # Endpoint OpenMetrics opcional (só importado se habilitado); os cgroups só são coletados para ele
+            from exporter import MetricsExporter
+            self.exporter = MetricsExporter(port=self._metrics_port, top_n=self._metrics_top_n)
+            self.exporter.start()
+            self.model.start_cgroups_thread()
+        try:
+            asyncio.run(self._serve())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.model.stop_processes_thread()
+            self.model.stop_specific_processes_thread()
+            self.model.stop_general_stats_thread()
+            if self.exporter:
+                self.model.stop_cgroups_thread()
+                self.exporter.stop()
+
+    async def _serve(self):
+        """
+        Aceita conexões e checa as queues do Model periodicamente (100ms).
+        """
+        server = await asyncio.start_server(self._handle_connection, *self._address)
+        print(f"Dashboard at http://{self._address[0]}:{self._address[1]}/")
+        async with server:
+            while True:
+                self._queue_check()
+                await asyncio.sleep(0.1)
+
+    def _queue_check(self):
+        """
+        Checa as queues do Model (não-bloqueante) e publica o que chegou (nos streams e no endpoint de métricas).
+        """
+        received = {}
+        for data_queue, publish in ((self.process_queue, self._publish_processes),
+                                    (self.general_stats_queue, self._publish_general_stats),
+                                    (self.specific_process_queue, self._publish_details),
+                                    (self.cgroups_queue, None)):
+            try:
+                data = data_queue.get_nowait()
+            except queue.Empty:
+                continue
+            received[data_queue] = data
+            if data and publish:
+                publish(data)
+        if self.exporter:
+            self.exporter.update(received.get(self.process_queue), received.get(self.general_stats_queue),
+                                 received.get(self.cgroups_queue))
+
+    ###############################################
+    # Publicação dos dados (calculada uma só vez) #
+    ###############################################
+    def _publish_processes(self, processes):
+        """
+        Envia só as linhas da lista de processos que mudaram desde a última coleta e os PIDs encerrados.
+        """
+        changed = {pid: row for pid, row in processes.items() if self._rows.get(pid) != row}
+        removed = [pid for pid in self._rows if pid not in processes]
+        self._rows = processes
+        if changed or removed:
+            self._broadcast(None, self._event("processes", {"reset": False, "upsert": changed, "remove": removed}))
+
+    def _publish_general_stats(self, general_stats):
+        """
+        Envia os dados gerais do sistema (pequenos, vão inteiros) se mudaram.
+        """
+        if general_stats != self._general_stats:
+            self._general_stats = general_stats
+            self._broadcast(None, self._event("general", general_stats))
+
+    def _publish_details(self, details):
+        """
+        Envia os detalhes de cada processo acompanhado só para os clientes da aba dele, e só se mudaram.
+        """
+        for pid, data in details.items():
+            if pid not in self._subscriptions or not data or self._details.get(pid) == data:
+                continue
+            self._details[pid] = data
+            if all(value is None for value in data):
+                # Processo foi encerrado (confirmado pelo Model)
+                self._broadcast(pid, self._event("ended", pid))
+            else:
+                self._broadcast(pid, self._event("detail", data))
+
+    def _event(self, name, data):
+        """
+        Serializa um evento SSE.
+        """
+        return f"event: {name}\ndata: {json.dumps(data, separators=(',', ':'), default=str)}\n\n".encode("utf-8")
+
+    def _broadcast(self, pid, event):
+        """
+        Coloca o evento (já serializado) na fila de cada cliente interessado.
+        """
+        for client in list(self._clients):
+            if client.pid != pid:
+                continue
+            try:
+                client.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Cliente lento: encerra o stream (ele reconecta e recebe um snapshot)
+                self._clients.discard(client)
+                while not client.queue.empty():
+                    client.queue.get_nowait()
+                client.queue.put_nowait(None)
+
+    ########
+    # HTTP #
+    ########
+    async def _handle_connection(self, reader, writer):
+        """
+        Lê um request HTTP/1.1 (só GET) e despacha pela rota.
+        """
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+            method, path = request.split(b"\r\n", 1)[0].decode("latin-1").split(" ")[:2]
+            path = path.split("?")[0]
+            if method != "GET":
+                await self._send(writer, 405, "text/plain", b"Method Not Allowed")
+            elif path == "/":
+                with open(os.path.join(self._STATIC_DIR, "index.html"), "rb") as f:
+                    await self._send(writer, 200, "text/html; charset=utf-8", f.read())
+            elif path == "/events":
+                await self._stream(writer)
+            elif path.startswith("/events/process/") and path[len("/events/process/"):].isdigit():
+                await self._stream(writer, int(path[len("/events/process/"):]))
+            else:
+                await self._send(writer, 404, "text/plain", b"Not Found")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _send(self, writer, status, content_type, body):
+        """
+        Envia uma resposta HTTP simples (não-streaming).
+        """
+        reason = {200: "OK", 404: "Not Found", 405: "Method Not Allowed"}[status]
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body)
+        await writer.drain()
+
+    async def _stream(self, writer, pid=None):
+        """
+        Mantém um stream SSE aberto: manda o snapshot atual e depois os eventos publicados.
+        """
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                     b"Connection: keep-alive\r\n\r\n")
+        client = _Client(pid)
+        if pid is None:
+            writer.write(self._event("processes", {"reset": True, "upsert": self._rows, "remove": []}))
+            if self._general_stats:
+                writer.write(self._event("general", self._general_stats))
+        else:
+            self._subscribe(pid)
+            if self._details.get(pid):
+                writer.write(self._event("detail", self._details[pid]))
+        self._clients.add(client)
+        try:
+            await writer.drain()
+            while True:
+                try:
+                    event = await asyncio.wait_for(client.queue.get(), self._KEEPALIVE)
+                except asyncio.TimeoutError:
+                    event = b": keepalive\n\n"
+                if event is None:
+                    break
+                writer.write(event)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(client)
+            if pid is not None:
+                self._unsubscribe(pid)
+
+    def _subscribe(self, pid):
+        """
+        Registra um cliente interessado no PID; o primeiro pede ao Model para começar a coletar os detalhes.
+        """
+        self._subscriptions[pid] = self._subscriptions.get(pid, 0) + 1
+        if self._subscriptions[pid] == 1:
+            self.specific_process_req_queue.put((pid, 'add'))
+
+    def _unsubscribe(self, pid):
+        """
+        Remove um cliente interessado no PID; quando não sobra nenhum, o Model para de coletar os detalhes.
+        """
+        self._subscriptions[pid] -= 1
+        if self._subscriptions[pid] == 0:
+            del self._subscriptions[pid]
+            self._details.pop(pid, None)
+            self.specific_process_req_queue.put((pid, 'remove'))